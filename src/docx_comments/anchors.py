@@ -21,6 +21,29 @@ def _qn(ns: str, name: str) -> str:
     return f"{{{ns}}}{name}"
 
 
+# Qualified names used when locating and building anchors
+_W_ID = _qn(NS_W, "id")
+_W_P = _qn(NS_W, "p")
+_W_R = _qn(NS_W, "r")
+_W_PPR = _qn(NS_W, "pPr")
+_W_TYPE = _qn(NS_W, "type")
+_W_COMMENT_RANGE_START = _qn(NS_W, "commentRangeStart")
+_W_COMMENT_RANGE_END = _qn(NS_W, "commentRangeEnd")
+_W_COMMENT_REFERENCE = _qn(NS_W, "commentReference")
+_W_HEADER_REFERENCE = _qn(NS_W, "headerReference")
+_W_FOOTER_REFERENCE = _qn(NS_W, "footerReference")
+_R_ID = _qn(NS_R, "id")
+
+# Anchor elements for a comment ID, in document order
+_XP_RANGE_START_BY_ID = etree.XPath(
+    ".//w:commentRangeStart[@w:id=$cid]", namespaces={"w": NS_W}
+)
+_XP_RANGE_END_BY_ID = etree.XPath(".//w:commentRangeEnd[@w:id=$cid]", namespaces={"w": NS_W})
+_XP_REFERENCE_BY_ID = etree.XPath(
+    ".//w:commentReference[@w:id=$cid]", namespaces={"w": NS_W}
+)
+
+
 class CommentAnchor:
     """Handler for comment anchors in document.xml."""
 
@@ -73,9 +96,9 @@ class CommentAnchor:
             sect_pr = getattr(section, "_sectPr", None)
             if sect_pr is None:
                 continue
-            for ref_tag in ("headerReference", "footerReference"):
-                for ref in sect_pr.findall(_qn(NS_W, ref_tag)):
-                    r_id = ref.get(_qn(NS_R, "id"))
+            for ref_tag in (_W_HEADER_REFERENCE, _W_FOOTER_REFERENCE):
+                for ref in sect_pr.findall(ref_tag):
+                    r_id = ref.get(_R_ID)
                     if not r_id:
                         continue
                     part = related_parts.get(r_id)
@@ -93,23 +116,15 @@ class CommentAnchor:
     def _find_anchor_elements(
         self, comment_id: str
     ) -> tuple[Optional[etree._Element], Optional[etree._Element], Optional[etree._Element]]:
-        start_xpath = (
-            f".//{_qn(NS_W, 'commentRangeStart')}[@{_qn(NS_W, 'id')}='{comment_id}']"
-        )
-        end_xpath = (
-            f".//{_qn(NS_W, 'commentRangeEnd')}[@{_qn(NS_W, 'id')}='{comment_id}']"
-        )
-        ref_xpath = (
-            f".//{_qn(NS_W, 'commentReference')}[@{_qn(NS_W, 'id')}='{comment_id}']"
-        )
-
         for root in self._iter_anchor_roots():
-            start = root.find(start_xpath)
-            end = root.find(end_xpath)
-            if start is None or end is None:
+            starts = _XP_RANGE_START_BY_ID(root, cid=comment_id)
+            if not starts:
                 continue
-            ref = root.find(ref_xpath)
-            return start, end, ref
+            ends = _XP_RANGE_END_BY_ID(root, cid=comment_id)
+            if not ends:
+                continue
+            refs = _XP_REFERENCE_BY_ID(root, cid=comment_id)
+            return starts[0], ends[0], refs[0] if refs else None
 
         return None, None, None
 
@@ -119,12 +134,12 @@ class CommentAnchor:
 
         for section in getattr(self._document, "sections", []):
             for attr, ref_tag, ref_type in (
-                ("header", "headerReference", None),
-                ("footer", "footerReference", None),
-                ("first_page_header", "headerReference", "first"),
-                ("first_page_footer", "footerReference", "first"),
-                ("even_page_header", "headerReference", "even"),
-                ("even_page_footer", "footerReference", "even"),
+                ("header", _W_HEADER_REFERENCE, None),
+                ("footer", _W_FOOTER_REFERENCE, None),
+                ("first_page_header", _W_HEADER_REFERENCE, "first"),
+                ("first_page_footer", _W_FOOTER_REFERENCE, "first"),
+                ("even_page_header", _W_HEADER_REFERENCE, "even"),
+                ("even_page_footer", _W_FOOTER_REFERENCE, "even"),
             ):
                 if not self._section_has_ref(section, ref_tag, ref_type):
                     continue
@@ -138,8 +153,8 @@ class CommentAnchor:
         sect_pr = getattr(section, "_sectPr", None)
         if sect_pr is None:
             return False
-        for ref in sect_pr.findall(_qn(NS_W, ref_tag)):
-            ref_type_attr = ref.get(_qn(NS_W, "type"))
+        for ref in sect_pr.findall(ref_tag):
+            ref_type_attr = ref.get(_W_TYPE)
             if ref_type is None:
                 if ref_type_attr in (None, "default"):
                     return True
@@ -167,7 +182,7 @@ class CommentAnchor:
             end_run: Index of last run to anchor (default: all runs).
         """
         para_elem = paragraph._element
-        runs = para_elem.findall(_qn(NS_W, "r"))
+        runs = para_elem.findall(_W_R)
 
         if not runs:
             # If no runs, anchor at paragraph level
@@ -183,19 +198,19 @@ class CommentAnchor:
             end_run = len(runs) - 1
 
         # Insert commentRangeStart before start_run
-        range_start = etree.Element(_qn(NS_W, "commentRangeStart"))
-        range_start.set(_qn(NS_W, "id"), comment_id)
+        range_start = etree.Element(_W_COMMENT_RANGE_START)
+        range_start.set(_W_ID, comment_id)
         runs[start_run].addprevious(range_start)
 
         # Insert commentRangeEnd after end_run
-        range_end = etree.Element(_qn(NS_W, "commentRangeEnd"))
-        range_end.set(_qn(NS_W, "id"), comment_id)
+        range_end = etree.Element(_W_COMMENT_RANGE_END)
+        range_end.set(_W_ID, comment_id)
         runs[end_run].addnext(range_end)
 
         # Insert commentReference run after commentRangeEnd
-        ref_run = etree.Element(_qn(NS_W, "r"))
-        ref = etree.SubElement(ref_run, _qn(NS_W, "commentReference"))
-        ref.set(_qn(NS_W, "id"), comment_id)
+        ref_run = etree.Element(_W_R)
+        ref = etree.SubElement(ref_run, _W_COMMENT_REFERENCE)
+        ref.set(_W_ID, comment_id)
         range_end.addnext(ref_run)
 
     def _add_anchors_to_empty_paragraph(
@@ -205,20 +220,20 @@ class CommentAnchor:
     ) -> None:
         """Add anchors to a paragraph with no runs."""
         # Create commentRangeStart
-        range_start = etree.Element(_qn(NS_W, "commentRangeStart"))
-        range_start.set(_qn(NS_W, "id"), comment_id)
+        range_start = etree.Element(_W_COMMENT_RANGE_START)
+        range_start.set(_W_ID, comment_id)
 
         # Create commentRangeEnd
-        range_end = etree.Element(_qn(NS_W, "commentRangeEnd"))
-        range_end.set(_qn(NS_W, "id"), comment_id)
+        range_end = etree.Element(_W_COMMENT_RANGE_END)
+        range_end.set(_W_ID, comment_id)
 
         # Create commentReference run
-        ref_run = etree.Element(_qn(NS_W, "r"))
-        ref = etree.SubElement(ref_run, _qn(NS_W, "commentReference"))
-        ref.set(_qn(NS_W, "id"), comment_id)
+        ref_run = etree.Element(_W_R)
+        ref = etree.SubElement(ref_run, _W_COMMENT_REFERENCE)
+        ref.set(_W_ID, comment_id)
 
         # Insert after pPr if present, else at start
-        pPr = para_elem.find(_qn(NS_W, "pPr"))
+        pPr = para_elem.find(_W_PPR)
         if pPr is not None:
             pPr.addnext(range_start)
         else:
@@ -249,36 +264,36 @@ class CommentAnchor:
 
         # Add new anchors after any existing anchor group for this location.
         def is_comment_ref_run(elem: etree._Element) -> bool:
-            if etree.QName(elem).localname != "r":
+            if elem.tag != _W_R:
                 return False
-            return elem.find(_qn(NS_W, "commentReference")) is not None
+            return elem.find(_W_COMMENT_REFERENCE) is not None
 
         # Insert new start after the last commentRangeStart in the group.
         insert_start_after = parent_start
         sibling = parent_start.getnext()
-        while sibling is not None and etree.QName(sibling).localname == "commentRangeStart":
+        while sibling is not None and sibling.tag == _W_COMMENT_RANGE_START:
             insert_start_after = sibling
             sibling = sibling.getnext()
 
-        new_start = etree.Element(_qn(NS_W, "commentRangeStart"))
-        new_start.set(_qn(NS_W, "id"), new_comment_id)
+        new_start = etree.Element(_W_COMMENT_RANGE_START)
+        new_start.set(_W_ID, new_comment_id)
         insert_start_after.addnext(new_start)
 
         # Insert new end after the last commentRangeEnd in the group.
         insert_end_after = parent_end
         sibling = parent_end.getnext()
-        while sibling is not None and etree.QName(sibling).localname == "commentRangeEnd":
+        while sibling is not None and sibling.tag == _W_COMMENT_RANGE_END:
             insert_end_after = sibling
             sibling = sibling.getnext()
 
-        new_end = etree.Element(_qn(NS_W, "commentRangeEnd"))
-        new_end.set(_qn(NS_W, "id"), new_comment_id)
+        new_end = etree.Element(_W_COMMENT_RANGE_END)
+        new_end.set(_W_ID, new_comment_id)
         insert_end_after.addnext(new_end)
 
         # Add reference run after existing commentReference runs (if any).
-        ref_run = etree.Element(_qn(NS_W, "r"))
-        ref = etree.SubElement(ref_run, _qn(NS_W, "commentReference"))
-        ref.set(_qn(NS_W, "id"), new_comment_id)
+        ref_run = etree.Element(_W_R)
+        ref = etree.SubElement(ref_run, _W_COMMENT_REFERENCE)
+        ref.set(_W_ID, new_comment_id)
         insert_ref_after = new_end
         sibling = new_end.getnext()
         while sibling is not None and is_comment_ref_run(sibling):
@@ -305,7 +320,7 @@ class CommentAnchor:
         # Walk up to find parent paragraph
         parent = range_start.getparent()
         while parent is not None:
-            if etree.QName(parent).localname == "p":
+            if parent.tag == _W_P:
                 # Find matching python-docx Paragraph
                 for para in self._iter_paragraphs():
                     if para._element is parent:
@@ -324,18 +339,14 @@ class CommentAnchor:
         """
         # Find and remove all anchor elements
         for root in self._iter_anchor_roots():
-            for tag in ["commentRangeStart", "commentRangeEnd"]:
-                for elem in root.findall(
-                    f".//{_qn(NS_W, tag)}[@{_qn(NS_W, 'id')}='{comment_id}']"
-                ):
+            for xpath in (_XP_RANGE_START_BY_ID, _XP_RANGE_END_BY_ID):
+                for elem in xpath(root, cid=comment_id):
                     elem.getparent().remove(elem)
 
             # Find and remove commentReference (and its parent run)
-            for ref in root.findall(
-                f".//{_qn(NS_W, 'commentReference')}[@{_qn(NS_W, 'id')}='{comment_id}']"
-            ):
+            for ref in _XP_REFERENCE_BY_ID(root, cid=comment_id):
                 ref_run = ref.getparent()
-                if ref_run is not None and etree.QName(ref_run).localname == "r":
+                if ref_run is not None and ref_run.tag == _W_R:
                     # Check if run only contains the reference
                     if len(ref_run) == 1:
                         ref_run.getparent().remove(ref_run)
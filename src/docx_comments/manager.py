@@ -4,14 +4,17 @@ from __future__ import annotations
 
 import os
 import random
-import uuid
+import sys
+from collections import defaultdict
+from contextlib import contextmanager
 from datetime import datetime, timezone
 from typing import TYPE_CHECKING, Any, Iterator, Optional, Union
+from xml.sax.saxutils import escape
 
 from lxml import etree
 
 from docx_comments.anchors import CommentAnchor
-from docx_comments.models import CommentInfo, CommentThread, PersonInfo
+from docx_comments.models import CommentExInfo, CommentInfo, CommentThread, PersonInfo
 from docx_comments.system_author import _default_person_from_system
 from docx_comments.xml_parts import (
     CommentsExtendedPart,
@@ -19,6 +22,7 @@ from docx_comments.xml_parts import (
     CommentsIdsPart,
     CommentsPart,
     PeoplePart,
+    _comments_context,
     ensure_comment_parts,
 )
 
@@ -35,20 +39,90 @@ NS_W16CID = "http://schemas.microsoft.com/office/word/2016/wordml/cid"
 
 PersonSpec = Union[PersonInfo, str, dict[str, Any], bool]
 
+_UTC = timezone.utc
+_MIN_DT = datetime.min.replace(tzinfo=_UTC)
+# Shared stand-in for comments without commentEx metadata (CommentExInfo is frozen)
+_NO_COMMENT_EX = CommentExInfo()
+
+# Serialized shape of a new comment, matching what Word writes. Values are
+# escaped by the caller; initials_attr is either empty or a full attribute.
+_COMMENT_TEMPLATE = (
+    f'<w:comment xmlns:w="{NS_W}" xmlns:w14="{NS_W14}"'
+    ' w:id="{comment_id}" w:author="{author}"{initials_attr} w:date="{date}">'
+    '<w:p w:rsidR="{rsid_r}" w:rsidRDefault="{rsid_default}"'
+    ' w14:paraId="{para_id}" w14:textId="{text_id}">'
+    '<w:pPr><w:pStyle w:val="CommentText"/></w:pPr>'
+    '<w:r><w:rPr><w:rStyle w:val="CommentReference"/></w:rPr><w:annotationRef/></w:r>'
+    '<w:r w:rsidRPr="{rsid_rpr}"><w:t>{text}</w:t></w:r>'
+    "</w:p>"
+    "</w:comment>"
+)
+# Entities beyond &, <, > so parsed values match what element.set()/.text store
+_ATTR_ENTITIES = {'"': "&quot;", "\n": "&#10;", "\r": "&#13;", "\t": "&#9;"}
+_TEXT_ENTITIES = {"\r": "&#13;"}
+
+# Precompiled XPath for comment enumeration (avoids per-call path parsing)
+_XP_COMMENT = etree.XPath("w:comment", namespaces={"w": NS_W})
+_XP_PARAS = etree.XPath("w:p", namespaces={"w": NS_W})
+_XP_COMMENT_BY_ID = etree.XPath("w:comment[@w:id=$cid]", namespaces={"w": NS_W})
+
 
 def _qn(ns: str, name: str) -> str:
     """Create qualified name with namespace."""
     return f"{{{ns}}}{name}"
 
 
+# Qualified names used on hot paths, computed once at import
+_W_ID = _qn(NS_W, "id")
+_W_AUTHOR = _qn(NS_W, "author")
+_W_INITIALS = _qn(NS_W, "initials")
+_W_DATE = _qn(NS_W, "date")
+_W_COMMENT = _qn(NS_W, "comment")
+_W_P = _qn(NS_W, "p")
+_W_RSIDR = _qn(NS_W, "rsidR")
+_W_RSID_DEFAULT = _qn(NS_W, "rsidRDefault")
+_W_PPR = _qn(NS_W, "pPr")
+_W_PSTYLE = _qn(NS_W, "pStyle")
+_W_VAL = _qn(NS_W, "val")
+_W_R = _qn(NS_W, "r")
+_W_RPR = _qn(NS_W, "rPr")
+_W_RSTYLE = _qn(NS_W, "rStyle")
+_W_ANNOTATION_REF = _qn(NS_W, "annotationRef")
+_W_RSID_RPR = _qn(NS_W, "rsidRPr")
+_W_T = _qn(NS_W, "t")
+_W14_PARAID = _qn(NS_W14, "paraId")
+_W14_TEXTID = _qn(NS_W14, "textId")
+_W15_COMMENT_EX = _qn(NS_W15, "commentEx")
+_W15_PARAID = _qn(NS_W15, "paraId")
+_W16CID_COMMENT_ID = _qn(NS_W16CID, "commentId")
+_W16CID_PARAID = _qn(NS_W16CID, "paraId")
+
+
 def _generate_id() -> str:
     """Generate a random comment ID (large positive integer as string)."""
     return str(random.randint(1_000_000_000, 9_999_999_999))
 
 
 def _generate_long_hex_id() -> str:
-    """Generate an 8-hex-digit ST_LongHexNumber within the valid range."""
-    return f"{random.randint(1, 0x7FFFFFFE):08X}"
+    """Generate an 8-hex-digit ST_LongHexNumber within the valid range.
+
+    IDs are interned since the same value is used as a key in several
+    per-document dicts (threading, durable IDs, para_id indexes).
+    """
+    value = random.getrandbits(31)
+    while not 0 < value < 0x7FFFFFFF:
+        value = random.getrandbits(31)
+    return sys.intern(f"{value:08X}")
+
+
+def _generate_rsids() -> tuple[str, str, str]:
+    """Generate three revision save IDs (8 uppercase hex characters each)."""
+    bits = random.getrandbits(96)
+    return (
+        f"{bits & 0xFFFFFFFF:08X}",
+        f"{(bits >> 32) & 0xFFFFFFFF:08X}",
+        f"{bits >> 64:08X}",
+    )
 
 
 def _generate_para_id() -> str:
@@ -61,26 +135,75 @@ def _generate_durable_id() -> str:
     return _generate_long_hex_id()
 
 
+def _escape_attr(value: str) -> str:
+    """Escape a string for use inside a double-quoted XML attribute."""
+    return escape(value, _ATTR_ENTITIES)
+
+
 def _format_utc(dt: datetime) -> str:
     """Format a timezone-aware datetime in UTC."""
-    return dt.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+    u = dt.astimezone(_UTC)
+    return "%04d-%02d-%02dT%02d:%02d:%02dZ" % (
+        u.year, u.month, u.day, u.hour, u.minute, u.second
+    )
 
 
 def _parse_comment_date(date_str: Optional[str]) -> Optional[datetime]:
     """Parse a comment date string into a tz-aware datetime."""
     if not date_str:
         return None
+    # Fast path for the usual Word format: YYYY-MM-DDTHH:MM:SSZ
+    if (
+        len(date_str) == 20
+        and date_str[19] == "Z"
+        and date_str[4] == "-"
+        and date_str[10] == "T"
+    ):
+        try:
+            return datetime(
+                int(date_str[0:4]),
+                int(date_str[5:7]),
+                int(date_str[8:10]),
+                int(date_str[11:13]),
+                int(date_str[14:16]),
+                int(date_str[17:19]),
+                tzinfo=_UTC,
+            )
+        except ValueError:
+            pass
     try:
         if date_str.endswith("Z"):
             return datetime.fromisoformat(date_str.replace("Z", "+00:00"))
         parsed = datetime.fromisoformat(date_str)
         if parsed.tzinfo is None:
-            return parsed.replace(tzinfo=timezone.utc)
-        return parsed.astimezone(timezone.utc)
+            return parsed.replace(tzinfo=_UTC)
+        return parsed.astimezone(_UTC)
     except ValueError:
         return None
 
 
+def _reply_sort_key(comment: CommentInfo, _min: datetime = _MIN_DT) -> datetime:
+    """Sort key ordering replies by timestamp, undated replies first."""
+    return comment.timestamp or _min
+
+
+def _select_para_id(
+    para_ids: list[str], threading: dict[str, CommentExInfo], durable_ids: dict[str, str]
+) -> Optional[str]:
+    """Pick the paraId that identifies a comment in the metadata parts.
+
+    Prefers the last paragraph with a commentEx entry, then the last with a
+    durable ID, then the last paragraph of the comment.
+    """
+    for pid in reversed(para_ids):
+        if pid in threading:
+            return pid
+    for pid in reversed(para_ids):
+        if pid in durable_ids:
+            return pid
+    return para_ids[-1] if para_ids else None
+
+
 class CommentManager:
     """
     Manager for Word document comments.
@@ -125,15 +248,27 @@ class CommentManager:
         """
         self._document = document
         self._comments_handler: Optional[CommentsPart] = None
+        self._ext_handler: Optional[CommentsExtendedPart] = None
+        self._ids_handler: Optional[CommentsIdsPart] = None
+        self._extensible_handler: Optional[CommentsExtensiblePart] = None
+        self._people_handler: Optional[PeoplePart] = None
+        self._anchor_handler: Optional[CommentAnchor] = None
+        # Shared with other managers on the document, including derived lookups
+        self._context = _comments_context(document)
         self._ensure_parts()
         if auto_migrate:
             self.migrate_comment_metadata()
 
     def _ensure_parts(self) -> None:
         """Ensure all required comment parts exist in the document."""
-        ensure_comment_parts(self._document)
-        # Cache the comments part handler
-        self._comments_handler = CommentsPart(self._document)
+        # Handlers are shared per document, so each XML part is parsed once
+        (
+            self._comments_handler,
+            self._ext_handler,
+            self._ids_handler,
+            self._extensible_handler,
+        ) = ensure_comment_parts(self._document)
+        self._people_handler = self._context.people
 
     @property
     def _comments_xml(self) -> etree._Element:
@@ -142,11 +277,148 @@ class CommentManager:
             self._comments_handler = CommentsPart(self._document)
         return self._comments_handler.xml
 
+    @property
+    def _ext_part(self) -> CommentsExtendedPart:
+        """Get the cached commentsExtended.xml handler."""
+        if self._ext_handler is None:
+            self._ext_handler = CommentsExtendedPart(self._document)
+        return self._ext_handler
+
+    @property
+    def _ids_part(self) -> CommentsIdsPart:
+        """Get the cached commentsIds.xml handler."""
+        if self._ids_handler is None:
+            self._ids_handler = CommentsIdsPart(self._document)
+        return self._ids_handler
+
+    @property
+    def _extensible_part(self) -> CommentsExtensiblePart:
+        """Get the cached commentsExtensible.xml handler."""
+        if self._extensible_handler is None:
+            self._extensible_handler = CommentsExtensiblePart(self._document)
+        return self._extensible_handler
+
+    @property
+    def _people_part(self) -> PeoplePart:
+        """Get the cached people.xml handler."""
+        if self._people_handler is None:
+            self._people_handler = PeoplePart(self._document)
+        return self._people_handler
+
+    @property
+    def _anchor(self) -> CommentAnchor:
+        """Get the cached document.xml anchor handler."""
+        if self._anchor_handler is None:
+            self._anchor_handler = CommentAnchor(self._document)
+        return self._anchor_handler
+
+    def _get_threading(self) -> dict[str, CommentExInfo]:
+        """Return threading info, re-read only after commentsExtended changes.
+
+        The returned dict is shared; callers must not mutate it.
+        """
+        ext_part, context = self._ext_part, self._context
+        key = ext_part._revision()
+        if context.threading_key != key:
+            context.threading = ext_part.get_threading_info()
+            context.threading_key = key
+        return context.threading
+
+    def _get_durable_ids(self) -> dict[str, str]:
+        """Return durable IDs, re-read only after commentsIds changes.
+
+        The returned dict is shared; callers must not mutate it.
+        """
+        ids_part, context = self._ids_part, self._context
+        key = ids_part._revision()
+        if context.durable_ids_key != key:
+            context.durable_ids = ids_part.get_durable_ids()
+            context.durable_ids_key = key
+        return context.durable_ids
+
     def _save_comments(self) -> None:
         """Save changes to comments.xml."""
         if self._comments_handler is not None:
             self._comments_handler._save()
 
+    def _id_index_revision(self) -> tuple[tuple[object, int], ...]:
+        """Revisions of the parts the comment_id -> para_id index reads."""
+        if self._comments_handler is None:
+            self._comments_handler = CommentsPart(self._document)
+        return (
+            self._comments_handler._revision(),
+            self._ext_part._revision(),
+            self._ids_part._revision(),
+        )
+
+    def _current_id_index(self) -> Optional[dict[str, str]]:
+        """Return the cached index if none of its parts changed since it was built."""
+        context = self._context
+        if context.id_index is not None and context.id_index_key == self._id_index_revision():
+            return context.id_index
+        return None
+
+    def _keep_id_index(
+        self, index: Optional[dict[str, str]], added: Optional[tuple[str, str]] = None
+    ) -> None:
+        """Mark an index updated alongside this manager's own writes as current.
+
+        ``added`` is a (comment_id, para_id) pair the writes introduced; it is
+        recorded in both directions.
+        """
+        context = self._context
+        if index is None or index is not context.id_index:
+            return
+        if added is not None:
+            comment_id, para_id = added
+            if comment_id not in index:
+                index[comment_id] = para_id
+                context.comment_ids_by_para_id[para_id] = comment_id
+        context.id_index_key = self._id_index_revision()
+
+    def _get_id_index(self) -> dict[str, str]:
+        """Return a cached comment_id -> para_id mapping.
+
+        Built from comments.xml and the metadata parts without reading comment
+        text or timestamps. Rebuilt whenever one of those parts changed,
+        including through another manager or handler.
+        """
+        context = self._context
+        key = self._id_index_revision()
+        if context.id_index is not None and context.id_index_key == key:
+            return context.id_index
+        threading = self._get_threading()
+        durable_ids = self._get_durable_ids()
+        index: dict[str, str] = {}
+        by_para_id: dict[str, str] = {}
+        for comment_elem in _XP_COMMENT(self._comments_xml):
+            comment_id = comment_elem.get(_W_ID)
+            if comment_id is None or comment_id in index:
+                continue
+            para_ids = [
+                sys.intern(pid)
+                for pid in (
+                    para.get(_W14_PARAID) for para in _XP_PARAS(comment_elem)
+                )
+                if pid
+            ]
+            para_id = _select_para_id(para_ids, threading, durable_ids) or ""
+            index[comment_id] = para_id
+            if para_id:
+                by_para_id[para_id] = comment_id
+        context.id_index = index
+        context.comment_ids_by_para_id = by_para_id
+        context.id_index_key = key
+        return index
+
+    def _get_comment_ids_by_para_id(self) -> dict[str, str]:
+        """Return the cached para_id -> comment_id inverse of the id index.
+
+        The returned dict is shared; callers must not mutate it.
+        """
+        self._get_id_index()
+        return self._context.comment_ids_by_para_id
+
     def _comment_index(
         self,
     ) -> tuple[list[CommentInfo], dict[str, CommentInfo], dict[str, CommentInfo]]:
@@ -186,30 +458,26 @@ class CommentManager:
 
     def _collect_comment_para_ids(self) -> set[str]:
         para_ids: set[str] = set()
-        for comment_elem in self._comments_xml.findall(_qn(NS_W, "comment")):
-            for para in comment_elem.findall(_qn(NS_W, "p")):
-                para_id = para.get(_qn(NS_W14, "paraId"))
+        for comment_elem in self._comments_xml.iterchildren(_W_COMMENT):
+            for para in comment_elem.iterchildren(_W_P):
+                para_id = para.get(_W14_PARAID)
                 if para_id:
                     para_ids.add(para_id)
         return para_ids
 
     def _cleanup_orphan_metadata(self, valid_para_ids: set[str]) -> None:
-        ext_part = CommentsExtendedPart(self._document)
-        ids_part = CommentsIdsPart(self._document)
-        extensible_part = CommentsExtensiblePart(self._document)
+        ext_part = self._ext_part
+        ids_part = self._ids_part
+        extensible_part = self._extensible_part
 
         orphan_para_ids: set[str] = set()
-        for elem in list(ext_part.xml):
-            if etree.QName(elem).localname != "commentEx":
-                continue
-            para_id = elem.get(_qn(NS_W15, "paraId"))
+        for elem in ext_part.xml.iterchildren(_W15_COMMENT_EX):
+            para_id = elem.get(_W15_PARAID)
             if para_id and para_id not in valid_para_ids:
                 orphan_para_ids.add(para_id)
 
-        for elem in list(ids_part.xml):
-            if etree.QName(elem).localname != "commentId":
-                continue
-            para_id = elem.get(_qn(NS_W16CID, "paraId"))
+        for elem in ids_part.xml.iterchildren(_W16CID_COMMENT_ID):
+            para_id = elem.get(_W16CID_PARAID)
             if para_id and para_id not in valid_para_ids:
                 orphan_para_ids.add(para_id)
 
@@ -224,7 +492,7 @@ class CommentManager:
             extensible_part.remove_comment_extensible(durable_id)
 
     def _detach_orphan_replies(self, valid_para_ids: set[str]) -> None:
-        ext_part = CommentsExtendedPart(self._document)
+        ext_part = self._ext_part
         for comment in self.list_comments():
             if not comment.para_id:
                 continue
@@ -242,57 +510,48 @@ class CommentManager:
         - commentsIds.xml entries (durableId)
         - commentsExtensible.xml entries (commentExtensible)
         """
-        ensure_comment_parts(self._document)
+        for handler in (
+            self._comments_handler,
+            self._ext_handler,
+            self._ids_handler,
+            self._extensible_handler,
+        ):
+            if handler is not None:
+                handler.ensure_exists()
 
-        ext_part = CommentsExtendedPart(self._document)
-        ids_part = CommentsIdsPart(self._document)
-        extensible_part = CommentsExtensiblePart(self._document)
+        ext_part = self._ext_part
+        ids_part = self._ids_part
+        extensible_part = self._extensible_part
         threading = ext_part.get_threading_info()
         durable_ids = ids_part.get_durable_ids()
         extensible_info = extensible_part.get_extensible_info()
 
         updated_comments = False
+        missing_ex: list[tuple[str, Optional[str], bool]] = []
 
-        for comment_elem in self._comments_xml.findall(_qn(NS_W, "comment")):
+        for comment_elem in self._comments_xml.iterchildren(_W_COMMENT):
             para_ids = []
-            for para in comment_elem.findall(_qn(NS_W, "p")):
-                para_id = para.get(_qn(NS_W14, "paraId"))
+            for para in comment_elem.iterchildren(_W_P):
+                para_id = para.get(_W14_PARAID)
                 if not para_id:
                     para_id = _generate_para_id()
-                    para.set(_qn(NS_W14, "paraId"), para_id)
+                    para.set(_W14_PARAID, para_id)
                     updated_comments = True
-                para_ids.append(para_id)
+                para_ids.append(sys.intern(para_id))
 
-                text_id = para.get(_qn(NS_W14, "textId"))
+                text_id = para.get(_W14_TEXTID)
                 if not text_id:
                     text_id = _generate_para_id()
-                    para.set(_qn(NS_W14, "textId"), text_id)
+                    para.set(_W14_TEXTID, text_id)
                     updated_comments = True
 
-            if not para_ids:
-                continue
-
-            primary_para_id = None
-            for pid in reversed(para_ids):
-                if pid in threading:
-                    primary_para_id = pid
-                    break
+            primary_para_id = _select_para_id(para_ids, threading, durable_ids)
             if primary_para_id is None:
-                for pid in reversed(para_ids):
-                    if pid in durable_ids:
-                        primary_para_id = pid
-                        break
-            if primary_para_id is None:
-                primary_para_id = para_ids[-1]
+                continue
 
             if primary_para_id not in threading:
-                ext_part.add_comment_ex(
-                    para_id=primary_para_id, parent_para_id=None, done=False
-                )
-                threading[primary_para_id] = {
-                    "parent_para_id": None,
-                    "done": False,
-                }
+                missing_ex.append((primary_para_id, None, False))
+                threading[primary_para_id] = CommentExInfo()
 
             if primary_para_id not in durable_ids:
                 durable_ids[primary_para_id] = _generate_durable_id()
@@ -307,7 +566,7 @@ class CommentManager:
                 durable_id not in extensible_info
                 or not (ext_entry or {}).get("date_utc")
             ):
-                date_str = comment_elem.get(_qn(NS_W, "date"))
+                date_str = comment_elem.get(_W_DATE)
                 timestamp = _parse_comment_date(date_str)
                 date_utc = _format_utc(timestamp) if timestamp else None
                 extensible_part.add_comment_extensible(
@@ -315,6 +574,7 @@ class CommentManager:
                     date_utc=date_utc,
                 )
 
+        ext_part.add_comments_ex_bulk(missing_ex)
         if updated_comments:
             self._save_comments()
 
@@ -325,77 +585,38 @@ class CommentManager:
         Yields:
             CommentInfo objects for each comment.
         """
-        # Collect comments from comments.xml
-        comments_data: list[dict] = []
+        threading: Optional[dict[str, CommentExInfo]] = None
+        durable_ids: dict[str, str] = {}
 
-        for comment_elem in self._comments_xml.findall(_qn(NS_W, "comment")):
-            comment_id = comment_elem.get(_qn(NS_W, "id"))
-            author = comment_elem.get(_qn(NS_W, "author"), "")
-            initials = comment_elem.get(_qn(NS_W, "initials"))
-            date_str = comment_elem.get(_qn(NS_W, "date"))
+        for comment_elem in self._comments_xml.iterchildren(_W_COMMENT):
+            if threading is None:
+                # Metadata parts are only read once there is a comment to report
+                threading = self._get_threading()
+                durable_ids = self._get_durable_ids()
 
             # Get text content
-            text_parts = []
-            for t_elem in comment_elem.findall(f".//{_qn(NS_W, 't')}"):
-                if t_elem.text:
-                    text_parts.append(t_elem.text)
-            text = "".join(text_parts)
+            text = "".join(t.text for t in comment_elem.iter(_W_T) if t.text)
 
             # Collect paraIds from all comment paragraphs (some comments span multiple paragraphs)
             para_ids = []
-            for para in comment_elem.findall(_qn(NS_W, "p")):
-                para_id = para.get(_qn(NS_W14, "paraId"))
+            for para in comment_elem.iterchildren(_W_P):
+                para_id = para.get(_W14_PARAID)
                 if para_id:
-                    para_ids.append(para_id)
-
-            # Parse timestamp (OOXML uses UTC, normalize all to tz-aware)
-            timestamp = _parse_comment_date(date_str)
-
-            comments_data.append(
-                {
-                    "comment_id": comment_id,
-                    "para_ids": para_ids,
-                    "text": text,
-                    "author": author,
-                    "initials": initials,
-                    "timestamp": timestamp,
-                }
-            )
-
-        # Get threading info from commentsExtended.xml
-        ext_part = CommentsExtendedPart(self._document)
-        threading = ext_part.get_threading_info()
-
-        # Get durable IDs from commentsIds.xml
-        ids_part = CommentsIdsPart(self._document)
-        durable_ids = ids_part.get_durable_ids()
+                    para_ids.append(sys.intern(para_id))
 
-        # Build CommentInfo objects
-        for info in comments_data:
-            para_ids = info["para_ids"]
-            para_id = None
-            for pid in reversed(para_ids):
-                if pid in threading:
-                    para_id = pid
-                    break
-            if para_id is None:
-                for pid in reversed(para_ids):
-                    if pid in durable_ids:
-                        para_id = pid
-                        break
-            if para_id is None and para_ids:
-                para_id = para_ids[-1]
-
-            thread_info = threading.get(para_id, {})
+            # Comments without paragraph IDs map to "", which no lookup contains
+            para_id = _select_para_id(para_ids, threading, durable_ids) or ""
+            thread_info = threading.get(para_id, _NO_COMMENT_EX)
             yield CommentInfo(
-                comment_id=info["comment_id"],
-                para_id=para_id or "",
-                text=info["text"],
-                author=info["author"],
-                initials=info["initials"],
-                timestamp=info["timestamp"],
-                parent_para_id=thread_info.get("parent_para_id"),
-                is_resolved=thread_info.get("done", False),
+                comment_id=comment_elem.get(_W_ID),
+                para_id=para_id,
+                text=text,
+                author=comment_elem.get(_W_AUTHOR, ""),
+                initials=comment_elem.get(_W_INITIALS),
+                # OOXML uses UTC, normalize all to tz-aware
+                timestamp=_parse_comment_date(comment_elem.get(_W_DATE)),
+                parent_para_id=thread_info.parent_para_id,
+                is_resolved=thread_info.done,
                 durable_id=durable_ids.get(para_id),
             )
 
@@ -425,24 +646,22 @@ class CommentManager:
             return current
 
         # Build threads by walking parent chains (supports reply-to-reply)
-        threads_by_root: dict[str, CommentThread] = {}
+        roots: dict[str, CommentInfo] = {}
+        replies_by_root: defaultdict[str, list[CommentInfo]] = defaultdict(list)
         for comment in comments:
             root = root_for(comment)
             root_key = thread_key(root)
-            thread = threads_by_root.get(root_key)
-            if thread is None:
-                thread = CommentThread(root=root, replies=[])
-                threads_by_root[root_key] = thread
-
+            roots.setdefault(root_key, root)
             if comment is not root:
-                thread.replies.append(comment)
+                replies_by_root[root_key].append(comment)
 
         # Sort replies by timestamp (use tz-aware min for comparison)
-        min_dt = datetime.min.replace(tzinfo=timezone.utc)
-        for thread in threads_by_root.values():
-            thread.replies.sort(key=lambda c: c.timestamp or min_dt)
-
-        return list(threads_by_root.values())
+        threads = []
+        for root_key, root in roots.items():
+            replies = replies_by_root.get(root_key, [])
+            replies.sort(key=_reply_sort_key)
+            threads.append(CommentThread(root=root, replies=replies))
+        return threads
 
     def get_authors(self) -> dict[str, str]:
         """
@@ -495,8 +714,7 @@ class CommentManager:
         Returns:
             List of PersonInfo entries. Empty if people.xml is absent.
         """
-        people_part = PeoplePart(self._document)
-        return people_part.get_people()
+        return self._people_part.get_people()
 
     def get_person(self, author: str) -> PersonInfo:
         """
@@ -511,8 +729,7 @@ class CommentManager:
         Raises:
             KeyError: If no matching person is found.
         """
-        people_part = PeoplePart(self._document)
-        return people_part.get_person(author)
+        return self._people_part.get_person(author)
 
     def ensure_person(
         self, author: str, presence: Optional[dict[str, str]] = None
@@ -527,8 +744,7 @@ class CommentManager:
         Returns:
             PersonInfo for the ensured entry.
         """
-        people_part = PeoplePart(self._document)
-        return people_part.ensure_person(author, presence)
+        return self._people_part.ensure_person(author, presence)
 
     def _parse_author_spec(self, author: PersonInfo) -> tuple[str, Optional[dict[str, str]]]:
         if not isinstance(author, PersonInfo):
@@ -626,9 +842,7 @@ class CommentManager:
         Returns:
             List of PersonInfo entries added to this document.
         """
-        source_part = PeoplePart(source)
-        target_part = PeoplePart(self._document)
-        return target_part.merge_from(source_part, include_presence)
+        return self._people_part.merge_from(_comments_context(source).people, include_presence)
 
     def _ensure_person_for_comment(
         self,
@@ -679,6 +893,23 @@ class CommentManager:
 
         self.ensure_person(person_author, presence)
 
+    @contextmanager
+    def batch(self) -> Iterator[CommentManager]:
+        """
+        Defer writing comment parts back to the package until the block exits.
+
+        Each change otherwise re-serializes the comment parts it touches.
+        Inside a batch every part is written at most once, when the
+        outermost batch exits. Managers on the same document share the
+        batch; part handlers created directly see the changes only after
+        that point.
+
+        Yields:
+            This manager.
+        """
+        with self._context.batch():
+            yield self
+
     def add_comment(
         self,
         paragraph: Paragraph,
@@ -716,6 +947,8 @@ class CommentManager:
         text_id = _generate_para_id()
         durable_id = _generate_durable_id()
 
+        # Only this manager's writes follow, so a current index can be kept
+        index = self._current_id_index()
         self._ensure_person_for_comment(author_name, person_spec)
 
         # 1. Add to comments.xml
@@ -729,7 +962,7 @@ class CommentManager:
         )
 
         # 2. Add anchors to document.xml
-        anchor = CommentAnchor(self._document)
+        anchor = self._anchor
         anchor.add_anchors(
             paragraph=paragraph,
             comment_id=comment_id,
@@ -738,20 +971,21 @@ class CommentManager:
         )
 
         # 3. Add to commentsExtended.xml (root comment, no parent)
-        ext_part = CommentsExtendedPart(self._document)
+        ext_part = self._ext_part
         ext_part.add_comment_ex(para_id=para_id, parent_para_id=None, done=False)
 
         # 4. Add to commentsIds.xml
-        ids_part = CommentsIdsPart(self._document)
+        ids_part = self._ids_part
         ids_part.add_comment_id(para_id=para_id, durable_id=durable_id)
 
         # 5. Add to commentsExtensible.xml (modern comments metadata)
-        extensible_part = CommentsExtensiblePart(self._document)
+        extensible_part = self._extensible_part
         extensible_part.add_comment_extensible(
             durable_id=durable_id,
             date_utc=_format_utc(timestamp),
         )
 
+        self._keep_id_index(index, (comment_id, para_id))
         return comment_id
 
     def reply_to_comment(
@@ -779,35 +1013,36 @@ class CommentManager:
             ValueError: If parent comment not found.
         """
         # Find parent comment's para_id and resolve root for compatibility.
-        comments = list(self.list_comments())
-        parent_comment = next((c for c in comments if c.comment_id == parent_id), None)
-
-        if parent_comment is None or not parent_comment.para_id:
+        parent_para_id = self._get_id_index().get(parent_id)
+        if not parent_para_id:
             self.migrate_comment_metadata()
-            comments = list(self.list_comments())
-            parent_comment = next((c for c in comments if c.comment_id == parent_id), None)
-            if parent_comment is None or not parent_comment.para_id:
+            parent_para_id = self._get_id_index().get(parent_id)
+            if not parent_para_id:
                 raise ValueError(f"Parent comment {parent_id} not found")
 
-        parent_para_id = parent_comment.para_id
-        parent_parent_para_id = parent_comment.parent_para_id
+        ext_part = self._ext_part
+        threading = self._get_threading()
+        comment_ids_by_para_id = self._get_comment_ids_by_para_id()
 
-        by_para_id = {c.para_id: c for c in comments if c.para_id}
-        root_comment = parent_comment
+        def parent_of(pid: str) -> Optional[str]:
+            return threading.get(pid, _NO_COMMENT_EX).parent_para_id
+
+        parent_parent_para_id = parent_of(parent_para_id)
+
+        root_para_id = parent_para_id
         seen: set[str] = set()
-        while (
-            root_comment.parent_para_id
-            and root_comment.parent_para_id in by_para_id
-            and root_comment.parent_para_id not in seen
-        ):
-            seen.add(root_comment.parent_para_id)
-            root_comment = by_para_id[root_comment.parent_para_id]
+        while True:
+            up = parent_of(root_para_id)
+            if not up or up not in comment_ids_by_para_id or up in seen:
+                break
+            seen.add(up)
+            root_para_id = up
 
         # Word UI doesn't support nested replies; attach to the root comment.
-        effective_parent_para_id = root_comment.para_id or parent_para_id
-        effective_parent_parent_para_id = root_comment.parent_para_id
+        effective_parent_para_id = root_para_id
+        effective_parent_parent_para_id = parent_of(root_para_id)
 
-        anchor = CommentAnchor(self._document)
+        anchor = self._anchor
 
         author_name, author_presence = self._parse_author_spec(author)
         person_spec = person
@@ -821,6 +1056,8 @@ class CommentManager:
         text_id = _generate_para_id()
         durable_id = _generate_durable_id()
 
+        # Only this manager's writes follow, so a current index can be kept
+        index = self._current_id_index()
         self._ensure_person_for_comment(author_name, person_spec)
 
         # 1. Add to comments.xml
@@ -834,15 +1071,13 @@ class CommentManager:
         )
 
         # 2. Add anchors at the root comment location for Word threading compatibility.
-        anchor_parent_id = root_comment.comment_id or parent_id
+        anchor_parent_id = comment_ids_by_para_id.get(root_para_id) or parent_id
         anchor.add_anchors_at_comment(
             parent_comment_id=anchor_parent_id,
             new_comment_id=comment_id,
         )
 
         # 3. Ensure parent exists in commentsExtended.xml, then add reply link
-        ext_part = CommentsExtendedPart(self._document)
-        threading = ext_part.get_threading_info()
         if parent_para_id not in threading:
             ext_part.add_comment_ex(
                 para_id=parent_para_id,
@@ -862,16 +1097,17 @@ class CommentManager:
         )
 
         # 4. Add to commentsIds.xml
-        ids_part = CommentsIdsPart(self._document)
+        ids_part = self._ids_part
         ids_part.add_comment_id(para_id=para_id, durable_id=durable_id)
 
         # 5. Add to commentsExtensible.xml (modern comments metadata)
-        extensible_part = CommentsExtensiblePart(self._document)
+        extensible_part = self._extensible_part
         extensible_part.add_comment_extensible(
             durable_id=durable_id,
             date_utc=_format_utc(timestamp),
         )
 
+        self._keep_id_index(index, (comment_id, para_id))
         return comment_id
 
     def resolve_comment(self, comment_id: str) -> None:
@@ -909,17 +1145,15 @@ class CommentManager:
         Raises:
             ValueError: If comment not found.
         """
-        para_id = None
-        for comment in self.list_comments():
-            if comment.comment_id == comment_id:
-                para_id = comment.para_id
-                break
-
+        index = self._get_id_index()
+        para_id = index.get(comment_id)
         if not para_id:
             raise ValueError(f"Comment {comment_id} not found")
 
-        ext_part = CommentsExtendedPart(self._document)
+        ext_part = self._ext_part
         ext_part.set_done(para_id, done=resolved)
+        # The done flag does not change which paragraph identifies a comment
+        self._keep_id_index(index)
 
     def delete_comment(self, comment_id: str) -> None:
         """
@@ -943,7 +1177,7 @@ class CommentManager:
             raise ValueError(f"Comment {comment_id} not found")
 
         # Remove anchors for this comment.
-        anchor = CommentAnchor(self._document)
+        anchor = self._anchor
         anchor.remove_anchors(comment_id)
 
         # Remove comment metadata entries.
@@ -970,7 +1204,7 @@ class CommentManager:
         if self._comments_handler is None:
             self._comments_handler = CommentsPart(self._document)
 
-        anchor = CommentAnchor(self._document)
+        anchor = self._anchor
         deleted_para_ids: set[str] = set()
 
         for comment in thread_comments:
@@ -1004,10 +1238,9 @@ class CommentManager:
         Raises:
             ValueError: If comment not found.
         """
-        _, by_id, _ = self._comment_index()
-        if comment_id not in by_id:
+        if not _XP_COMMENT_BY_ID(self._comments_xml, cid=comment_id):
             raise ValueError(f"Comment {comment_id} not found")
-        anchor = CommentAnchor(self._document)
+        anchor = self._anchor
         anchor.remove_anchors(comment_id)
         anchor.add_anchors(paragraph, comment_id, start_run=start_run, end_run=end_run)
 
@@ -1040,7 +1273,7 @@ class CommentManager:
             raise ValueError(f"Comment {comment_id} not found")
         root = self._root_for(target, by_para_id)
 
-        anchor = CommentAnchor(self._document)
+        anchor = self._anchor
         for comment in thread_comments:
             anchor.remove_anchors(comment.comment_id)
 
@@ -1064,10 +1297,10 @@ class CommentManager:
         if not para_ids:
             return
 
-        ext_part = CommentsExtendedPart(self._document)
-        ids_part = CommentsIdsPart(self._document)
-        extensible_part = CommentsExtensiblePart(self._document)
-        durable_ids = ids_part.get_durable_ids()
+        ext_part = self._ext_part
+        ids_part = self._ids_part
+        extensible_part = self._extensible_part
+        durable_ids = self._get_durable_ids()
 
         for para_id in para_ids:
             ext_part.remove_comment_ex(para_id)
@@ -1087,49 +1320,87 @@ class CommentManager:
         timestamp: Optional[datetime] = None,
     ) -> datetime:
         """Add a comment element to comments.xml and return its timestamp."""
-        rsid_r = uuid.uuid4().hex[:8].upper()
-        rsid_default = uuid.uuid4().hex[:8].upper()
-        rsid_rpr = uuid.uuid4().hex[:8].upper()
-
-        # Build comment element
-        comment = etree.SubElement(self._comments_xml, _qn(NS_W, "comment"))
-        comment.set(_qn(NS_W, "id"), comment_id)
-        comment.set(_qn(NS_W, "author"), author)
-        if initials:
-            comment.set(_qn(NS_W, "initials"), initials)
+        rsid_r, rsid_default, rsid_rpr = _generate_rsids()
+
         # Use local time with offset so Word displays the expected timestamp.
         if timestamp is None:
             timestamp = datetime.now().astimezone()
-        comment.set(
-            _qn(NS_W, "date"),
-            timestamp.isoformat(timespec="seconds"),
-        )
+        date_str = timestamp.isoformat(timespec="seconds")
+
+        # Build the whole comment subtree with a single parse.
+        initials_attr = f' w:initials="{_escape_attr(initials)}"' if initials else ""
+        try:
+            comment = etree.fromstring(
+                _COMMENT_TEMPLATE.format(
+                    comment_id=_escape_attr(comment_id),
+                    author=_escape_attr(author),
+                    initials_attr=initials_attr,
+                    date=date_str,
+                    rsid_r=rsid_r,
+                    rsid_default=rsid_default,
+                    para_id=para_id,
+                    text_id=text_id,
+                    rsid_rpr=rsid_rpr,
+                    text=escape(text, _TEXT_ENTITIES),
+                )
+            )
+        except etree.XMLSyntaxError:
+            # Not representable in XML (e.g. control characters); build with the
+            # element API so the caller gets lxml's usual ValueError.
+            comment = self._build_comment_elem(
+                comment_id, para_id, text_id, text, author, initials, date_str,
+                rsid_r, rsid_default, rsid_rpr,
+            )
+        self._comments_xml.append(comment)
+
+        # Save changes to the part
+        self._save_comments()
+        return timestamp
+
+    @staticmethod
+    def _build_comment_elem(
+        comment_id: str,
+        para_id: str,
+        text_id: str,
+        text: str,
+        author: str,
+        initials: Optional[str],
+        date_str: str,
+        rsid_r: str,
+        rsid_default: str,
+        rsid_rpr: str,
+    ) -> etree._Element:
+        """Build a comment element node by node."""
+        attrib = {_W_ID: comment_id, _W_AUTHOR: author}
+        if initials:
+            attrib[_W_INITIALS] = initials
+        attrib[_W_DATE] = date_str
+        comment = etree.Element(_W_COMMENT, attrib)
 
         # Add paragraph
-        para = etree.SubElement(comment, _qn(NS_W, "p"))
-        para.set(_qn(NS_W, "rsidR"), rsid_r)
-        para.set(_qn(NS_W, "rsidRDefault"), rsid_default)
-        para.set(_qn(NS_W14, "paraId"), para_id)
-        para.set(_qn(NS_W14, "textId"), text_id)
+        para = etree.SubElement(
+            comment,
+            _W_P,
+            {
+                _W_RSIDR: rsid_r,
+                _W_RSID_DEFAULT: rsid_default,
+                _W14_PARAID: para_id,
+                _W14_TEXTID: text_id,
+            },
+        )
 
         # Add paragraph properties with CommentText style
-        pPr = etree.SubElement(para, _qn(NS_W, "pPr"))
-        pStyle = etree.SubElement(pPr, _qn(NS_W, "pStyle"))
-        pStyle.set(_qn(NS_W, "val"), "CommentText")
+        pPr = etree.SubElement(para, _W_PPR)
+        etree.SubElement(pPr, _W_PSTYLE, {_W_VAL: "CommentText"})
 
         # Add run with annotationRef
-        run1 = etree.SubElement(para, _qn(NS_W, "r"))
-        rPr = etree.SubElement(run1, _qn(NS_W, "rPr"))
-        rStyle = etree.SubElement(rPr, _qn(NS_W, "rStyle"))
-        rStyle.set(_qn(NS_W, "val"), "CommentReference")
-        etree.SubElement(run1, _qn(NS_W, "annotationRef"))
+        run1 = etree.SubElement(para, _W_R)
+        rPr = etree.SubElement(run1, _W_RPR)
+        etree.SubElement(rPr, _W_RSTYLE, {_W_VAL: "CommentReference"})
+        etree.SubElement(run1, _W_ANNOTATION_REF)
 
         # Add run with text
-        run2 = etree.SubElement(para, _qn(NS_W, "r"))
-        run2.set(_qn(NS_W, "rsidRPr"), rsid_rpr)
-        t = etree.SubElement(run2, _qn(NS_W, "t"))
+        run2 = etree.SubElement(para, _W_R, {_W_RSID_RPR: rsid_rpr})
+        t = etree.SubElement(run2, _W_T)
         t.text = text
-
-        # Save changes to the part
-        self._save_comments()
-        return timestamp
+        return comment
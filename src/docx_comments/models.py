@@ -1,11 +1,15 @@
 """Data models for comment information."""
 
+import sys
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Optional
+from typing import Any, Optional
 
+# Slotted instances drop the per-object __dict__ (dataclass slots need 3.10+)
+_SLOTS: dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(**_SLOTS)
 class CommentInfo:
     """Information about a single comment."""
 
@@ -42,7 +46,22 @@ class CommentInfo:
         return self.parent_para_id is not None
 
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
+class CommentExInfo:
+    """Threading metadata for a comment paragraph (w15:commentEx).
+
+    Immutable, so one instance can safely stand in for every comment
+    without a commentEx entry.
+    """
+
+    parent_para_id: Optional[str] = None
+    """Parent paragraph ID for replies (w15:paraIdParent)."""
+
+    done: bool = False
+    """Whether comment is marked as done (w15:done)."""
+
+
+@dataclass(**_SLOTS)
 class PersonInfo:
     """Information about a person entry in people.xml."""
 
@@ -61,7 +80,7 @@ class PersonInfo:
         return bool(self.provider_id and self.user_id)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class CommentThread:
     """A comment thread with root comment and replies."""
 
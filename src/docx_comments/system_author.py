@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 import os
 import sys
 import warnings
@@ -12,6 +13,7 @@ from zipfile import ZipFile
 from lxml import etree
 
 from docx_comments.models import PersonInfo
+from docx_comments.xml_parts import read_people
 
 
 def _system_office_user_info() -> Tuple[Optional[str], Optional[str]]:
@@ -24,12 +26,20 @@ def _system_office_user_info() -> Tuple[Optional[str], Optional[str]]:
 
 def _macos_office_user_info() -> Tuple[Optional[str], Optional[str]]:
     path = Path.home() / "Library/Group Containers/UBF8T346G9.Office/MeContact.plist"
-    if not path.exists():
+    try:
+        mtime_ns = path.stat().st_mtime_ns
+    except OSError:
         return None, None
+    return _macos_me_contact(str(path), mtime_ns)
+
+
+@functools.lru_cache(maxsize=1)
+def _macos_me_contact(path: str, mtime_ns: int) -> Tuple[Optional[str], Optional[str]]:
+    # mtime_ns only keys the cache so an edited MeContact.plist is re-read
     try:
         import plistlib
 
-        with path.open("rb") as handle:
+        with open(path, "rb") as handle:
             data = plistlib.load(handle)
     except Exception:
         return None, None
@@ -46,17 +56,39 @@ def _macos_office_user_info() -> Tuple[Optional[str], Optional[str]]:
     return name, initials
 
 
+_WINDOWS_USER_INFO_KEYS = (
+    r"Software\Microsoft\Office\Common\UserInfo",
+    r"Software\Microsoft\Office\16.0\Common\UserInfo",
+)
+
+
 def _windows_office_user_info() -> Tuple[Optional[str], Optional[str]]:
+    if sys.platform != "win32":
+        return None, None
     try:
         import winreg  # type: ignore[import-not-found]
     except Exception:
         return None, None
 
-    keys = [
-        r"Software\Microsoft\Office\Common\UserInfo",
-        r"Software\Microsoft\Office\16.0\Common\UserInfo",
-    ]
-    for key_path in keys:
+    stamps: list[Optional[int]] = []
+    for key_path in _WINDOWS_USER_INFO_KEYS:
+        try:
+            with winreg.OpenKey(winreg.HKEY_CURRENT_USER, key_path) as key:
+                stamps.append(winreg.QueryInfoKey(key)[2])
+        except OSError:
+            stamps.append(None)
+    return _windows_user_info(tuple(stamps))
+
+
+@functools.lru_cache(maxsize=1)
+def _windows_user_info(stamps: Tuple[Optional[int], ...]) -> Tuple[Optional[str], Optional[str]]:
+    # The keys' last-write times only key the cache so a changed Office user
+    # is re-read, as MeContact.plist's mtime does on macOS
+    if sys.platform != "win32":
+        return None, None
+    import winreg
+
+    for key_path in _WINDOWS_USER_INFO_KEYS:
         try:
             with winreg.OpenKey(winreg.HKEY_CURRENT_USER, key_path) as key:
                 name, _ = winreg.QueryValueEx(key, "UserName")
@@ -82,72 +114,57 @@ def _person_from_docx(
 ) -> Tuple[Optional[PersonInfo], Optional[str]]:
     if not docx_path:
         return None, None
-    if not Path(docx_path).exists():
+    try:
+        stat = os.stat(docx_path)
+    except OSError:
         return None, None
 
     try:
-        with ZipFile(docx_path) as zf:
-            names = set(zf.namelist())
-            person = _docx_single_person(zf, names, include_presence)
-            return person, None
+        people = _load_people(docx_path, stat.st_mtime_ns, stat.st_size)
+        person = _docx_single_person(people, include_presence)
+        return person, None
     except _DocxAuthorAmbiguous:
         raise
     except Exception:
         return None, None
 
 
-def _docx_single_person(
-    zf: ZipFile, names: set[str], include_presence: bool
-) -> PersonInfo:
-    if "word/people.xml" not in names:
-        raise _DocxAuthorAmbiguous("DOCX author source has no people.xml")
+# (author, provider_id, user_id) for each people.xml entry
+_PersonFields = Tuple[str, Optional[str], Optional[str]]
+
+
+@functools.lru_cache(maxsize=8)
+def _load_people(docx_path: str, mtime_ns: int, size: int) -> Tuple[_PersonFields, ...]:
+    # mtime_ns and size only key the cache so rewritten sources are re-read.
+    # Plain tuples are cached rather than the parsed tree, which callers
+    # could otherwise mutate for every later lookup.
+    with ZipFile(docx_path) as zf:
+        try:
+            raw = zf.read("word/people.xml")
+        except KeyError:
+            raise _DocxAuthorAmbiguous("DOCX author source has no people.xml")
     try:
-        xml = etree.fromstring(zf.read("word/people.xml"))
+        xml = etree.fromstring(raw)
     except Exception:
         raise _DocxAuthorAmbiguous("DOCX author source has invalid people.xml")
+    return tuple((p.author, p.provider_id, p.user_id) for p in read_people(xml))
+
 
-    people = [elem for elem in xml if etree.QName(elem).localname == "person"]
+def _docx_single_person(
+    people: Tuple[_PersonFields, ...], include_presence: bool
+) -> PersonInfo:
     if len(people) != 1:
-        raise _DocxAuthorAmbiguous(
-            f"DOCX author source has {len(people)} people entries"
-        )
+        raise _DocxAuthorAmbiguous(f"DOCX author source has {len(people)} people entries")
 
-    elem = people[0]
-    author = _attr_by_localname(elem, "author") or ""
+    author, provider_id, user_id = people[0]
     if not author:
         raise _DocxAuthorAmbiguous("DOCX author source person has no author name")
 
     if not include_presence:
         return PersonInfo(author=author)
-
-    presence_elem = _find_child_by_localname(elem, "presenceInfo")
-    provider_id = user_id = None
-    if presence_elem is not None:
-        provider_id = _attr_by_localname(presence_elem, "providerId")
-        user_id = _attr_by_localname(presence_elem, "userId")
     return PersonInfo(author=author, provider_id=provider_id, user_id=user_id)
 
 
-def _attr_by_localname(elem: etree._Element, localname: str) -> Optional[str]:
-    for attr, value in elem.attrib.items():
-        try:
-            if etree.QName(attr).localname == localname:
-                return value
-        except (ValueError, TypeError):
-            if attr == localname:
-                return value
-    return None
-
-
-def _find_child_by_localname(
-    elem: etree._Element, localname: str
-) -> Optional[etree._Element]:
-    for child in elem:
-        if etree.QName(child).localname == localname:
-            return child
-    return None
-
-
 def _default_person_from_system(
     docx_path: Optional[str] = None,
     include_presence: bool = False,
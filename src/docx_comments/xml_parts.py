@@ -2,16 +2,23 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Optional
+import functools
+import sys
+import weakref
+from array import array
+from contextlib import ExitStack, contextmanager
+from io import BytesIO
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Iterable, Iterator, Mapping, Optional, TypeVar, cast
 
 from docx.opc.packuri import PackURI
 from docx.opc.part import Part
 from lxml import etree
 
-from docx_comments.models import PersonInfo
+from docx_comments.models import CommentExInfo, PersonInfo
 
 if TYPE_CHECKING:
-    from docx import Document
+    from docx.document import Document
 
 
 # OOXML Namespaces
@@ -35,6 +42,9 @@ REL_PEOPLE = "http://schemas.microsoft.com/office/2011/relationships/people"
 REL_COMMENTS_EXTENSIBLE = (
     "http://schemas.microsoft.com/office/2018/08/relationships/commentsExtensible"
 )
+_COMMENT_RELTYPES = frozenset(
+    (REL_COMMENTS, REL_COMMENTS_EXT, REL_COMMENTS_IDS, REL_COMMENTS_EXTENSIBLE, REL_PEOPLE)
+)
 
 # Content types
 CT_COMMENTS = "application/vnd.openxmlformats-officedocument.wordprocessingml.comments+xml"
@@ -55,7 +65,244 @@ def _qn(ns: str, name: str) -> str:
     return f"{{{ns}}}{name}"
 
 
-class CommentsPart:
+# Qualified names used by the part handlers
+QN_W_COMMENT = _qn(NS_W, "comment")
+QN_W_COMMENTS = _qn(NS_W, "comments")
+QN_W_ID = _qn(NS_W, "id")
+QN_W_P = _qn(NS_W, "p")
+QN_W14_PARAID = _qn(NS_W14, "paraId")
+QN_W15_AUTHOR = _qn(NS_W15, "author")
+QN_W15_COMMENT_EX = _qn(NS_W15, "commentEx")
+QN_W15_COMMENTS_EX = _qn(NS_W15, "commentsEx")
+QN_W15_DONE = _qn(NS_W15, "done")
+QN_W15_PARAID = _qn(NS_W15, "paraId")
+QN_W15_PARAID_PARENT = _qn(NS_W15, "paraIdParent")
+QN_W15_PEOPLE = _qn(NS_W15, "people")
+QN_W15_PERSON = _qn(NS_W15, "person")
+QN_W15_PRESENCE_INFO = _qn(NS_W15, "presenceInfo")
+QN_W15_PROVIDER_ID = _qn(NS_W15, "providerId")
+QN_W15_USER_ID = _qn(NS_W15, "userId")
+QN_W16CID_COMMENT_ID = _qn(NS_W16CID, "commentId")
+QN_W16CID_COMMENTS_IDS = _qn(NS_W16CID, "commentsIds")
+QN_W16CID_DURABLE_ID = _qn(NS_W16CID, "durableId")
+QN_W16CID_PARAID = _qn(NS_W16CID, "paraId")
+QN_W16CEX_COMMENT_EXTENSIBLE = _qn(NS_W16CEX, "commentExtensible")
+QN_W16CEX_COMMENTS_EXTENSIBLE = _qn(NS_W16CEX, "commentsExtensible")
+QN_W16CEX_DATE_UTC = _qn(NS_W16CEX, "dateUtc")
+QN_W16CEX_DURABLE_ID = _qn(NS_W16CEX, "durableId")
+QN_MC_IGNORABLE = _qn(NS_MC, "Ignorable")
+
+# Entries matching an ID, found in libxml2 rather than by a Python-level scan
+_XP_COMMENT_BY_ID = etree.XPath("w:comment[@w:id=$cid]", namespaces={"w": NS_W})
+_XP_COMMENT_EX_BY_PARA_ID = etree.XPath(
+    "w15:commentEx[@w15:paraId=$pid]", namespaces={"w15": NS_W15}
+)
+_XP_COMMENT_EXTENSIBLE_BY_DURABLE_ID = etree.XPath(
+    "w16cex:commentExtensible[@w16cex:durableId=$did]", namespaces={"w16cex": NS_W16CEX}
+)
+_XP_COMMENT_ID_BY_PARA_ID = etree.XPath(
+    "w16cid:commentId[@w16cid:paraId=$pid]", namespaces={"w16cid": NS_W16CID}
+)
+
+# paraId/durableId of complete commentId entries; the two lists pair up in order
+_CID_COMPLETE = "w16cid:commentId[@w16cid:paraId != '' and @w16cid:durableId != '']"
+_XP_CID_PARA_IDS = etree.XPath(
+    f"{_CID_COMPLETE}/@w16cid:paraId",
+    namespaces={"w16cid": NS_W16CID},
+    smart_strings=False,
+)
+_XP_CID_DURABLE_IDS = etree.XPath(
+    f"{_CID_COMPLETE}/@w16cid:durableId",
+    namespaces={"w16cid": NS_W16CID},
+    smart_strings=False,
+)
+
+
+# Part serializer: UTF-8 with a standalone XML declaration, as Word writes
+_serialize = functools.partial(
+    etree.tostring, xml_declaration=True, encoding="UTF-8", standalone="yes"
+)
+
+# Parser for the metadata parts, which carry no text content: drop
+# whitespace-only nodes and skip ID collection and entity expansion
+_METADATA_PARSER = etree.XMLParser(
+    remove_blank_text=True, collect_ids=False, resolve_entities=False
+)
+
+# Metadata blobs above this size are streamed by read-only getters when the
+# handler has not parsed them yet, instead of building a full tree
+_STREAM_PARSE_THRESHOLD = 1 << 20
+
+
+def _iter_blob_entries(blob: bytes, tag: str) -> Iterator[etree._Element]:
+    """Stream matching entries from a part blob, discarding each after use."""
+    events = etree.iterparse(
+        BytesIO(blob),
+        events=("end",),
+        tag=tag,
+        remove_blank_text=True,
+        collect_ids=False,
+        resolve_entities=False,
+    )
+    for _, elem in events:
+        yield elem
+        elem.clear()
+        while elem.getprevious() is not None:
+            del elem.getparent()[0]
+
+
+def _stream_unparsed(
+    part: Optional[Part], parsed_blob: Optional[bytes], tag: str
+) -> Optional[Iterator[etree._Element]]:
+    """Stream entries from a large part blob the handler has not parsed.
+
+    Returns None when the handler's parsed tree is current or the blob is
+    small enough to parse, in which case the caller reads its tree.
+    """
+    if part is None or part.blob is parsed_blob:
+        return None
+    if len(part.blob) <= _STREAM_PARSE_THRESHOLD:
+        return None
+    return _iter_blob_entries(part.blob, tag)
+
+
+# Namespace declarations for each part root (read-only, shared)
+_NSMAP_COMMENTS = MappingProxyType({"w": NS_W, "w14": NS_W14, "w15": NS_W15, "mc": NS_MC})
+_NSMAP_COMMENTS_EXT = MappingProxyType({"mc": NS_MC, "w15": NS_W15})
+_NSMAP_COMMENTS_IDS = MappingProxyType({"mc": NS_MC, "w16cid": NS_W16CID})
+_NSMAP_COMMENTS_EXTENSIBLE = MappingProxyType({"mc": NS_MC, "w16cex": NS_W16CEX})
+_NSMAP_PEOPLE = MappingProxyType(
+    {"mc": NS_MC, "w": NS_W, "w14": NS_W14, "w15": NS_W15, "wp14": NS_WP14}
+)
+
+
+def _empty_part_xml(tag: str, nsmap: Mapping[str, str], ignorable: str) -> bytes:
+    """Serialize an empty part root with its namespace declarations."""
+    root = etree.Element(tag, nsmap=nsmap)
+    root.set(QN_MC_IGNORABLE, ignorable)
+    content: bytes = _serialize(root)
+    return content
+
+
+# Initial content of newly created parts (identical for every document)
+_EMPTY_COMMENTS_XML = _empty_part_xml(QN_W_COMMENTS, _NSMAP_COMMENTS, "w14 w15")
+_EMPTY_COMMENTS_EXT_XML = _empty_part_xml(
+    QN_W15_COMMENTS_EX, _NSMAP_COMMENTS_EXT, "w15"
+)
+_EMPTY_COMMENTS_IDS_XML = _empty_part_xml(
+    QN_W16CID_COMMENTS_IDS, _NSMAP_COMMENTS_IDS, "w16cid"
+)
+_EMPTY_COMMENTS_EXTENSIBLE_XML = _empty_part_xml(
+    QN_W16CEX_COMMENTS_EXTENSIBLE, _NSMAP_COMMENTS_EXTENSIBLE, "w16cex"
+)
+_EMPTY_PEOPLE_XML = _empty_part_xml(QN_W15_PEOPLE, _NSMAP_PEOPLE, "w14 w15 wp14")
+
+
+def _scan_comment_parts(doc_part) -> dict[str, Part]:
+    """Map comment and people reltypes to their parts in one pass."""
+    found: dict[str, Part] = {}
+    for rel in doc_part.rels.values():
+        if rel.reltype in _COMMENT_RELTYPES and rel.reltype not in found:
+            found[rel.reltype] = rel.target_part
+    return found
+
+
+def _find_comment_part(doc_part, reltype: str) -> Optional[Part]:
+    """Look up a comment or people part by relationship type."""
+    for rel in doc_part.rels.values():
+        if rel.reltype == reltype:
+            target: Part = rel.target_part
+            return target
+    return None
+
+
+# Parsed trees of generic (newly created) comments parts, with the blob each
+# was parsed from, shared by every CommentsPart wrapper over the same part
+_GENERIC_COMMENTS_TREES: weakref.WeakKeyDictionary[Part, tuple[bytes, etree._Element]] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+# Change counters per part, bumped by every handler save. Derived data cached
+# outside the handlers compares them to notice changes made through any handler.
+_PART_REVISIONS: weakref.WeakKeyDictionary[Part, int] = weakref.WeakKeyDictionary()
+
+
+class _DeferredWrites:
+    """Deferred-write support shared by the part handlers.
+
+    Handlers call _save() after each change and implement _write() to
+    serialize; inside batch() writes are held back and flushed once.
+    """
+
+    _deferred = False
+    _dirty = False
+    _part_ref: Optional[weakref.ref[Part]] = None
+
+    @property
+    def _part(self) -> Optional[Part]:
+        """The resolved part, held weakly; the document's relationships own it."""
+        return None if self._part_ref is None else self._part_ref()
+
+    @_part.setter
+    def _part(self, part: Optional[Part]) -> None:
+        self._part_ref = None if part is None else weakref.ref(part)
+
+    def _get_part(self) -> Optional[Part]:
+        raise NotImplementedError
+
+    def _write(self) -> None:
+        raise NotImplementedError
+
+    def _content_token(self, part: Part) -> object:
+        """Object that is replaced whenever the part content is reloaded."""
+        return part.blob
+
+    def _revision(self) -> tuple[object, int]:
+        """Return a token that changes whenever the part may have changed.
+
+        Covers saves through any handler on the part, including deferred
+        ones, and blobs replaced outside the handlers.
+        """
+        part = self._get_part()
+        if part is None:
+            return None, 0
+        return self._content_token(part), _PART_REVISIONS.get(part, 0)
+
+    def _save(self) -> None:
+        """Save changes back to the part, or mark them pending while deferred."""
+        part = self._get_part()
+        if part is not None:
+            _PART_REVISIONS[part] = _PART_REVISIONS.get(part, 0) + 1
+        if self._deferred:
+            self._dirty = True
+            return
+        self._write()
+
+    @contextmanager
+    def batch(self: _HandlerT) -> Iterator[_HandlerT]:
+        """Hold back writes to the part until the outermost batch exits."""
+        if self._deferred:
+            yield self
+            return
+        self._deferred = True
+        try:
+            yield self
+        finally:
+            self._deferred = False
+            self.flush()
+
+    def flush(self) -> None:
+        """Write changes held back by a deferred save to the part."""
+        if self._dirty:
+            self._dirty = False
+            self._write()
+
+
+_HandlerT = TypeVar("_HandlerT", bound=_DeferredWrites)
+
+
+class CommentsPart(_DeferredWrites):
     """Handler for word/comments.xml part.
 
     Note: python-docx loads comments.xml as an XmlPart subclass (CommentsPart)
@@ -63,16 +310,18 @@ class CommentsPart:
     part._element directly to persist changes.
     """
 
-    def __init__(self, document: Document) -> None:
+    def __init__(self, document: Document, part: Optional[Part] = None) -> None:
         self._document = document
-        self._xml: Optional[etree._Element] = None
+        # Stand-in root returned only while no part can be read
+        self._empty: Optional[etree._Element] = None
+        self._part = part
+        self._is_xmlpart: Optional[bool] = None
 
     def _get_part(self):
-        """Get the comments part from document relationships."""
-        for rel in self._document.part.rels.values():
-            if REL_COMMENTS in rel.reltype:
-                return rel.target_part
-        return None
+        """Get the comments part from document relationships (cached)."""
+        if self._part is None:
+            self._part = _find_comment_part(self._document.part, REL_COMMENTS)
+        return self._part
 
     def ensure_exists(self) -> None:
         """Ensure the comments part exists, creating if needed."""
@@ -81,34 +330,22 @@ class CommentsPart:
 
     def _create_part(self) -> None:
         """Create a new comments.xml part."""
-        # Create XML content with required namespaces
-        nsmap = {
-            "w": NS_W,
-            "w14": NS_W14,
-            "w15": NS_W15,
-            "mc": NS_MC,
-        }
-        root = etree.Element(
-            _qn(NS_W, "comments"),
-            nsmap=nsmap,
-        )
-        root.set(_qn(NS_MC, "Ignorable"), "w14 w15")
-
-        xml_content = etree.tostring(
-            root,
-            xml_declaration=True,
-            encoding="UTF-8",
-            standalone="yes",
-        )
-
         # Create generic part (python-docx will load it as XmlPart on next open)
         part = Part(
             PackURI("/word/comments.xml"),
             CT_COMMENTS,
-            xml_content,
+            _EMPTY_COMMENTS_XML,
             self._document.part.package,
         )
         self._document.part.relate_to(part, REL_COMMENTS)
+        self._part = part
+        self._is_xmlpart = False
+
+    def _part_is_xml(self, part: Part) -> bool:
+        """Return whether the part keeps its own element tree (cached)."""
+        if self._is_xmlpart is None:
+            self._is_xmlpart = hasattr(part, "_element")
+        return self._is_xmlpart
 
     @property
     def xml(self) -> etree._Element:
@@ -116,42 +353,58 @@ class CommentsPart:
 
         Handles two cases:
         - XmlPart (from existing document): use part._element directly
-        - Generic Part (newly created): parse and cache from blob
+        - Generic Part (newly created): parse once per blob, so every
+          CommentsPart wrapper for the document shares one tree
         """
         part = self._get_part()
         if part is None:
             # Shouldn't happen after ensure_exists
-            return etree.Element(_qn(NS_W, "comments"))
+            return self._empty_root()
 
-        # Prefer public accessor when available (ensures _element initialized)
-        if hasattr(part, "element"):
+        if self._part_is_xml(part):
+            # Prefer public accessor when available (ensures _element initialized)
             try:
                 elem = part.element
                 if elem is not None:
                     return elem
             except (AttributeError, TypeError, ValueError, etree.XMLSyntaxError):
-                # Best-effort fallback for python-docx element access.
+                # Best-effort fallback to the private element below.
                 pass
 
-        # Fallback for XmlPart with private _element (ensure initialized)
-        if hasattr(part, "_element"):
-            if getattr(part, "_element", None) is None:
+            # Fallback for XmlPart with private _element (ensure initialized)
+            elem = part._element
+            if elem is None:
                 try:
-                    part._element = etree.fromstring(part.blob)
+                    elem = part._element = etree.fromstring(part.blob)
                 except (etree.XMLSyntaxError, AttributeError, TypeError):
                     # XMLSyntaxError: malformed XML in blob
                     # AttributeError: part lacks blob attribute
                     # TypeError: blob is None or wrong type
-                    return etree.Element(_qn(NS_W, "comments"))
-            return part._element
+                    return self._empty_root()
+            return elem
 
-        # Generic Part - need to parse blob and maintain cache
-        if self._xml is None:
-            self._xml = etree.fromstring(part.blob)
-        return self._xml
+        # Generic Part - parse blob unless the shared tree is current
+        cached = _GENERIC_COMMENTS_TREES.get(part)
+        if cached is None or cached[0] is not part.blob:
+            cached = (part.blob, etree.fromstring(part.blob))
+            _GENERIC_COMMENTS_TREES[part] = cached
+        return cached[1]
 
-    def _save(self) -> None:
-        """Save changes back to the part.
+    def _content_token(self, part: Part) -> object:
+        # The parsed tree, rather than the blob an XmlPart would serialize
+        return self.xml
+
+    def _empty_root(self) -> etree._Element:
+        """Return an empty comments root, allocated once per handler.
+
+        Only used when no part can be read; changes made to it are not saved.
+        """
+        if self._empty is None:
+            self._empty = etree.Element(QN_W_COMMENTS)
+        return self._empty
+
+    def _write(self) -> None:
+        """Serialize changes back to the part.
 
         - XmlPart: changes to _element persist automatically
         - Generic Part: need to update _blob
@@ -161,17 +414,14 @@ class CommentsPart:
             return
 
         # XmlPart doesn't need explicit save
-        if hasattr(part, "_element"):
+        if self._part_is_xml(part):
             return
 
-        # Generic Part - update _blob from cached xml
-        if self._xml is not None:
-            part._blob = etree.tostring(
-                self._xml,
-                xml_declaration=True,
-                encoding="UTF-8",
-                standalone="yes",
-            )
+        # Generic Part - update _blob from the shared tree
+        cached = _GENERIC_COMMENTS_TREES.get(part)
+        if cached is not None:
+            part._blob = _serialize(cached[1])
+            _GENERIC_COMMENTS_TREES[part] = (part._blob, cached[1])
 
     def remove_comment(self, comment_id: str) -> Optional[list[str]]:
         """
@@ -183,68 +433,63 @@ class CommentsPart:
         Returns:
             List of paraIds found on the removed comment, or None if not found.
         """
+        root = self.xml
+        matches = _XP_COMMENT_BY_ID(root, cid=comment_id)
+        if not matches:
+            return None
+
         removed_para_ids: list[str] = []
-        removed = False
-
-        for elem in list(self.xml):
-            if etree.QName(elem).localname != "comment":
-                continue
-            if elem.get(_qn(NS_W, "id")) != comment_id:
-                continue
-            for para in elem.findall(_qn(NS_W, "p")):
-                para_id = para.get(_qn(NS_W14, "paraId"))
+        for elem in matches:
+            for para in elem.iterchildren(QN_W_P):
+                para_id = para.get(QN_W14_PARAID)
                 if para_id:
                     removed_para_ids.append(para_id)
-            elem.getparent().remove(elem)
-            removed = True
-
-        if removed:
-            self._save()
-            return removed_para_ids
+            root.remove(elem)
 
-        return None
+        self._save()
+        return removed_para_ids
 
 
-def ensure_comment_parts(document: Document) -> None:
+def ensure_comment_parts(
+    document: Document,
+) -> tuple[CommentsPart, CommentsExtendedPart, CommentsIdsPart, CommentsExtensiblePart]:
     """
     Ensure all required comment parts exist in the document.
 
+    The handlers are shared by every caller working on the same document,
+    so their parts, parsed trees and indexes are resolved once.
+
     Creates:
     - comments.xml if missing
     - commentsExtended.xml if missing
     - commentsIds.xml if missing
     - commentsExtensible.xml if missing
-    """
-    # Ensure comments.xml (main comments part)
-    comments_part = CommentsPart(document)
-    comments_part.ensure_exists()
-
-    # Ensure commentsExtended.xml
-    ext_part = CommentsExtendedPart(document)
-    ext_part.ensure_exists()
 
-    # Ensure commentsIds.xml
-    ids_part = CommentsIdsPart(document)
-    ids_part.ensure_exists()
-
-    # Ensure commentsExtensible.xml (modern comments metadata)
-    extensible_part = CommentsExtensiblePart(document)
-    extensible_part.ensure_exists()
+    Returns:
+        Handlers for the comments, commentsExtended, commentsIds and
+        commentsExtensible parts, bound to the existing or created parts.
+    """
+    context = _comments_context(document)
+    for handler in (context.comments, context.extended, context.ids, context.extensible):
+        handler.ensure_exists()
+    return context.comments, context.extended, context.ids, context.extensible
 
 
-class CommentsExtendedPart:
+class CommentsExtendedPart(_DeferredWrites):
     """Handler for word/commentsExtended.xml part."""
 
-    def __init__(self, document: Document) -> None:
+    def __init__(self, document: Document, part: Optional[Part] = None) -> None:
         self._document = document
         self._xml: Optional[etree._Element] = None
+        self._part = part
+        self._blob: Optional[bytes] = None
+        self._index: Optional[dict[str, etree._Element]] = None
 
     def _get_part(self):
-        """Get the commentsExtended part from document relationships."""
-        for rel in self._document.part.rels.values():
-            if REL_COMMENTS_EXT in rel.reltype:
-                return rel.target_part
-        return None
+        """Get the commentsExtended part from document relationships (cached)."""
+        if self._part is None:
+            self._part = _find_comment_part(self._document.part, REL_COMMENTS_EXT)
+        return self._part
 
     def ensure_exists(self) -> None:
         """Ensure the commentsExtended part exists, creating if needed."""
@@ -253,76 +498,99 @@ class CommentsExtendedPart:
 
     def _create_part(self) -> None:
         """Create a new commentsExtended.xml part."""
-        # Create XML content
-        nsmap = {
-            "mc": NS_MC,
-            "w15": NS_W15,
-        }
-        root = etree.Element(
-            _qn(NS_W15, "commentsEx"),
-            nsmap=nsmap,
-        )
-        root.set(_qn(NS_MC, "Ignorable"), "w15")
-
-        xml_content = etree.tostring(
-            root,
-            xml_declaration=True,
-            encoding="UTF-8",
-            standalone="yes",
-        )
-
         # Add part to document
         # Note: This requires accessing python-docx internals
         part = Part(
             PackURI("/word/commentsExtended.xml"),
             CT_COMMENTS_EXT,
-            xml_content,
+            _EMPTY_COMMENTS_EXT_XML,
             self._document.part.package,
         )
         self._document.part.relate_to(part, REL_COMMENTS_EXT)
+        self._part = part
 
     @property
     def xml(self) -> etree._Element:
-        """Get the XML root element."""
-        if self._xml is None:
-            part = self._get_part()
-            if part:
-                self._xml = etree.fromstring(part.blob)
-            else:
-                # Return empty element if part doesn't exist
-                self._xml = etree.Element(_qn(NS_W15, "commentsEx"))
+        """Get the XML root element.
+
+        The parsed tree is cached and re-parsed only if another handler has
+        replaced the part blob since it was read.
+        """
+        part = self._get_part()
+        if part:
+            if self._xml is None or part.blob is not self._blob:
+                self._blob = part.blob
+                self._xml = etree.fromstring(self._blob, _METADATA_PARSER)
+                self._index = None
+        elif self._xml is None:
+            # Return empty element if part doesn't exist
+            self._xml = etree.Element(QN_W15_COMMENTS_EX)
         return self._xml
 
-    def _save(self) -> None:
-        """Save changes back to the part."""
+    def _write(self) -> None:
+        """Serialize changes back to the part."""
         part = self._get_part()
         if part:
-            part._blob = etree.tostring(
-                self.xml,
-                xml_declaration=True,
-                encoding="UTF-8",
-                standalone="yes",
-            )
+            part._blob = _serialize(self.xml)
+            self._blob = part._blob
+
+    def _get_index(self) -> dict[str, etree._Element]:
+        """Return a paraId -> commentEx mapping, built on first use."""
+        xml = self.xml
+        if self._index is None:
+            index: dict[str, etree._Element] = {}
+            for elem in xml.iterchildren(QN_W15_COMMENT_EX):
+                para_id = elem.get(QN_W15_PARAID)
+                if para_id:
+                    index.setdefault(para_id, elem)
+            self._index = index
+        return self._index
+
+    def _iter_entries(self) -> Iterator[etree._Element]:
+        """Iterate commentEx entries, streaming large blobs not yet parsed."""
+        entries = _stream_unparsed(self._get_part(), self._blob, QN_W15_COMMENT_EX)
+        if entries is None:
+            entries = self.xml.iterchildren(QN_W15_COMMENT_EX)
+        return entries
+
+    def get_threading_arrays(self) -> tuple[list[str], list[Optional[str]], array]:
+        """
+        Get threading information as parallel arrays.
 
-    def get_threading_info(self) -> dict[str, dict]:
+        Cheaper than get_threading_info() for callers that scan every entry.
+
+        Returns:
+            Tuple of (para_ids, parent_para_ids, done), where done is an
+            array('b') of 0/1 flags aligned with para_ids.
+        """
+        # IDs are interned: they are looked up repeatedly across these maps
+        intern = sys.intern
+        qn_para_id, qn_parent, qn_done = QN_W15_PARAID, QN_W15_PARAID_PARENT, QN_W15_DONE
+        para_ids: list[str] = []
+        parents: list[Optional[str]] = []
+        done = array("b")
+        for elem in self._iter_entries():
+            get = elem.get
+            para_id = get(qn_para_id)
+            if para_id:
+                parent = get(qn_parent)
+                para_ids.append(intern(para_id))
+                parents.append(intern(parent) if parent else parent)
+                done.append(get(qn_done, "0") == "1")
+        return para_ids, parents, done
+
+    def get_threading_info(self) -> dict[str, CommentExInfo]:
         """
         Get threading information for all comments.
 
         Returns:
-            Dict mapping para_id to {"parent_para_id": str|None, "done": bool}
+            Dict mapping para_id to CommentExInfo(parent_para_id, done)
         """
-        result = {}
-        for elem in self.xml:
-            if etree.QName(elem).localname == "commentEx":
-                para_id = elem.get(_qn(NS_W15, "paraId"))
-                parent = elem.get(_qn(NS_W15, "paraIdParent"))
-                done = elem.get(_qn(NS_W15, "done"), "0") == "1"
-                if para_id:
-                    result[para_id] = {
-                        "parent_para_id": parent,
-                        "done": done,
-                    }
-        return result
+        para_ids, parents, done = self.get_threading_arrays()
+        return {
+            para_id: CommentExInfo(parent, bool(flag))
+            for para_id, parent, flag in zip(para_ids, parents, done)
+        }
 
     def add_comment_ex(
         self,
@@ -338,25 +606,53 @@ class CommentsExtendedPart:
             parent_para_id: Paragraph ID of parent (for replies).
             done: Whether comment is resolved.
         """
-        elem = etree.Element(_qn(NS_W15, "commentEx"))
-        elem.set(_qn(NS_W15, "paraId"), para_id)
-        elem.set(_qn(NS_W15, "done"), "1" if done else "0")
+        attrib = {QN_W15_PARAID: para_id, QN_W15_DONE: "1" if done else "0"}
         if parent_para_id:
-            elem.set(_qn(NS_W15, "paraIdParent"), parent_para_id)
-        inserted = False
-        if parent_para_id:
-            for existing in self.xml:
-                if (
-                    etree.QName(existing).localname == "commentEx"
-                    and existing.get(_qn(NS_W15, "paraId")) == parent_para_id
-                ):
-                    existing.addnext(elem)
-                    inserted = True
-                    break
-        if not inserted:
-            self.xml.append(elem)
+            attrib[QN_W15_PARAID_PARENT] = parent_para_id
+        index = self._get_index()
+        parent = index.get(parent_para_id) if parent_para_id else None
+        if parent is not None:
+            elem = etree.Element(QN_W15_COMMENT_EX, attrib)
+            parent.addnext(elem)
+        else:
+            elem = etree.SubElement(self.xml, QN_W15_COMMENT_EX, attrib)
+        index.setdefault(para_id, elem)
         self._save()
 
+    def add_comments_ex_bulk(self, entries: Iterable[tuple[str, Optional[str], bool]]) -> None:
+        """
+        Add several commentEx entries and save the part once.
+
+        Args:
+            entries: (para_id, parent_para_id, done) tuples, placed as
+                add_comment_ex() would place them one at a time.
+        """
+        root = self.xml
+        index = self._get_index()
+        make_element, sub_element = etree.Element, etree.SubElement
+        tag, qn_para_id, qn_parent, qn_done = (
+            QN_W15_COMMENT_EX,
+            QN_W15_PARAID,
+            QN_W15_PARAID_PARENT,
+            QN_W15_DONE,
+        )
+        added = False
+        for para_id, parent_para_id, done in entries:
+            attrib = {qn_para_id: para_id, qn_done: "1" if done else "0"}
+            parent = None
+            if parent_para_id:
+                attrib[qn_parent] = parent_para_id
+                parent = index.get(parent_para_id)
+            if parent is not None:
+                elem = make_element(tag, attrib)
+                parent.addnext(elem)
+            else:
+                elem = sub_element(root, tag, attrib)
+            index.setdefault(para_id, elem)
+            added = True
+        if added:
+            self._save()
+
     def set_done(self, para_id: str, done: bool) -> None:
         """
         Set the done status for a comment.
@@ -365,12 +661,13 @@ class CommentsExtendedPart:
             para_id: Paragraph ID of the comment.
             done: Whether comment is resolved.
         """
-        for elem in self.xml:
-            if etree.QName(elem).localname == "commentEx":
-                if elem.get(_qn(NS_W15, "paraId")) == para_id:
-                    elem.set(_qn(NS_W15, "done"), "1" if done else "0")
-                    self._save()
-                    return
+        elem = self._get_index().get(para_id)
+        if elem is not None:
+            value = "1" if done else "0"
+            if elem.get(QN_W15_DONE) != value:
+                elem.set(QN_W15_DONE, value)
+                self._save()
+            return
         raise ValueError(f"Comment with para_id {para_id} not found in commentsExtended")
 
     def set_parent(self, para_id: str, parent_para_id: Optional[str]) -> bool:
@@ -384,18 +681,18 @@ class CommentsExtendedPart:
         Returns:
             True if an entry was updated, False otherwise.
         """
-        for elem in self.xml:
-            if etree.QName(elem).localname != "commentEx":
-                continue
-            if elem.get(_qn(NS_W15, "paraId")) != para_id:
-                continue
-            if parent_para_id:
-                elem.set(_qn(NS_W15, "paraIdParent"), parent_para_id)
-            else:
-                elem.attrib.pop(_qn(NS_W15, "paraIdParent"), None)
-            self._save()
+        elem = self._get_index().get(para_id)
+        if elem is None:
+            return False
+        parent_para_id = parent_para_id or None
+        if elem.get(QN_W15_PARAID_PARENT) == parent_para_id:
             return True
-        return False
+        if parent_para_id:
+            elem.set(QN_W15_PARAID_PARENT, parent_para_id)
+        else:
+            elem.attrib.pop(QN_W15_PARAID_PARENT, None)
+        self._save()
+        return True
 
     def remove_comment_ex(self, para_id: str) -> bool:
         """
@@ -407,36 +704,41 @@ class CommentsExtendedPart:
         Returns:
             True if an entry was removed, False otherwise.
         """
-        removed = False
-        for elem in list(self.xml):
-            if etree.QName(elem).localname != "commentEx":
-                continue
-            if elem.get(_qn(NS_W15, "paraId")) != para_id:
-                continue
-            elem.getparent().remove(elem)
-            removed = True
-        if removed:
-            self._save()
-        return removed
+        root = self.xml
+        matches = _XP_COMMENT_EX_BY_PARA_ID(root, pid=para_id)
+        if not matches:
+            return False
+        for elem in matches:
+            root.remove(elem)
+        if self._index is not None:
+            self._index.pop(para_id, None)
+        self._save()
+        return True
 
 
-class CommentsExtensiblePart:
+class CommentsExtensiblePart(_DeferredWrites):
     """Handler for word/commentsExtensible.xml part."""
 
-    def __init__(self, document: Document) -> None:
+    def __init__(self, document: Document, part: Optional[Part] = None) -> None:
         self._document = document
         self._xml: Optional[etree._Element] = None
+        self._part = part
+        self._blob: Optional[bytes] = None
+        self._index: Optional[dict[str, etree._Element]] = None
 
     def _get_part(self):
-        """Get the commentsExtensible part from document relationships."""
+        """Get the commentsExtensible part from document relationships (cached)."""
+        if self._part is not None:
+            return self._part
         doc_part = self._document.part
-        for rel in doc_part.rels.values():
-            if "commentsExtensible" in rel.reltype:
-                return rel.target_part
+        self._part = _find_comment_part(doc_part, REL_COMMENTS_EXTENSIBLE)
+        if self._part is not None:
+            return self._part
         package = getattr(doc_part, "package", None)
         if package is not None:
             for part in getattr(package, "parts", []):
                 if str(part.partname) == "/word/commentsExtensible.xml":
+                    self._part = part
                     return part
         return None
 
@@ -447,52 +749,53 @@ class CommentsExtensiblePart:
 
     def _create_part(self) -> None:
         """Create a new commentsExtensible.xml part."""
-        nsmap = {
-            "mc": NS_MC,
-            "w16cex": NS_W16CEX,
-        }
-        root = etree.Element(
-            _qn(NS_W16CEX, "commentsExtensible"),
-            nsmap=nsmap,
-        )
-        root.set(_qn(NS_MC, "Ignorable"), "w16cex")
-
-        xml_content = etree.tostring(
-            root,
-            xml_declaration=True,
-            encoding="UTF-8",
-            standalone="yes",
-        )
-
         part = Part(
             PackURI("/word/commentsExtensible.xml"),
             CT_COMMENTS_EXTENSIBLE,
-            xml_content,
+            _EMPTY_COMMENTS_EXTENSIBLE_XML,
             self._document.part.package,
         )
         self._document.part.relate_to(part, REL_COMMENTS_EXTENSIBLE)
+        self._part = part
 
     @property
     def xml(self) -> etree._Element:
-        """Get the XML root element."""
-        if self._xml is None:
-            part = self._get_part()
-            if part:
-                self._xml = etree.fromstring(part.blob)
-            else:
-                self._xml = etree.Element(_qn(NS_W16CEX, "commentsExtensible"))
+        """Get the XML root element (re-parsed if the part blob was replaced)."""
+        part = self._get_part()
+        if part:
+            if self._xml is None or part.blob is not self._blob:
+                self._blob = part.blob
+                self._xml = etree.fromstring(self._blob, _METADATA_PARSER)
+                self._index = None
+        elif self._xml is None:
+            self._xml = etree.Element(QN_W16CEX_COMMENTS_EXTENSIBLE)
         return self._xml
 
-    def _save(self) -> None:
-        """Save changes back to the part."""
+    def _write(self) -> None:
+        """Serialize changes back to the part."""
         part = self._get_part()
         if part:
-            part._blob = etree.tostring(
-                self.xml,
-                xml_declaration=True,
-                encoding="UTF-8",
-                standalone="yes",
-            )
+            part._blob = _serialize(self.xml)
+            self._blob = part._blob
+
+    def _get_index(self) -> dict[str, etree._Element]:
+        """Return a durableId -> commentExtensible mapping, built on first use."""
+        xml = self.xml
+        if self._index is None:
+            index: dict[str, etree._Element] = {}
+            for elem in xml.iterchildren(QN_W16CEX_COMMENT_EXTENSIBLE):
+                durable_id = elem.get(QN_W16CEX_DURABLE_ID)
+                if durable_id:
+                    index.setdefault(durable_id, elem)
+            self._index = index
+        return self._index
+
+    def _iter_entries(self) -> Iterator[etree._Element]:
+        """Iterate commentExtensible entries, streaming large unparsed blobs."""
+        entries = _stream_unparsed(self._get_part(), self._blob, QN_W16CEX_COMMENT_EXTENSIBLE)
+        if entries is None:
+            entries = self.xml.iterchildren(QN_W16CEX_COMMENT_EXTENSIBLE)
+        return entries
 
     def get_extensible_info(self) -> dict[str, dict]:
         """
@@ -501,13 +804,17 @@ class CommentsExtensiblePart:
         Returns:
             Dict mapping durable_id to {"date_utc": str|None}.
         """
+        intern = sys.intern
+        qn_durable_id, qn_date_utc = QN_W16CEX_DURABLE_ID, QN_W16CEX_DATE_UTC
         result = {}
-        for elem in self.xml:
-            if etree.QName(elem).localname == "commentExtensible":
-                durable_id = elem.get(_qn(NS_W16CEX, "durableId"))
-                date_utc = elem.get(_qn(NS_W16CEX, "dateUtc"))
-                if durable_id:
-                    result[durable_id] = {"date_utc": date_utc}
+        for elem in self._iter_entries():
+            get = elem.get
+            durable_id = get(qn_durable_id)
+            if durable_id:
+                date_utc = get(qn_date_utc)
+                result[intern(durable_id)] = {
+                    "date_utc": intern(date_utc) if date_utc else date_utc
+                }
         return result
 
     def add_comment_extensible(self, durable_id: str, date_utc: Optional[str] = None) -> None:
@@ -518,20 +825,19 @@ class CommentsExtensiblePart:
             durable_id: Durable ID for the comment.
             date_utc: Optional UTC timestamp (ISO8601, Z-terminated).
         """
-        for elem in self.xml:
-            if (
-                etree.QName(elem).localname == "commentExtensible"
-                and elem.get(_qn(NS_W16CEX, "durableId")) == durable_id
-            ):
-                if date_utc and not elem.get(_qn(NS_W16CEX, "dateUtc")):
-                    elem.set(_qn(NS_W16CEX, "dateUtc"), date_utc)
-                    self._save()
-                return
+        index = self._get_index()
+        existing = index.get(durable_id)
+        if existing is not None:
+            if date_utc and not existing.get(QN_W16CEX_DATE_UTC):
+                existing.set(QN_W16CEX_DATE_UTC, date_utc)
+                self._save()
+            return
 
-        elem = etree.SubElement(self.xml, _qn(NS_W16CEX, "commentExtensible"))
-        elem.set(_qn(NS_W16CEX, "durableId"), durable_id)
+        attrib = {QN_W16CEX_DURABLE_ID: durable_id}
         if date_utc:
-            elem.set(_qn(NS_W16CEX, "dateUtc"), date_utc)
+            attrib[QN_W16CEX_DATE_UTC] = date_utc
+        elem = etree.SubElement(self.xml, QN_W16CEX_COMMENT_EXTENSIBLE, attrib)
+        index[durable_id] = elem
         self._save()
 
     def remove_comment_extensible(self, durable_id: str) -> bool:
@@ -544,32 +850,33 @@ class CommentsExtensiblePart:
         Returns:
             True if an entry was removed, False otherwise.
         """
-        removed = False
-        for elem in list(self.xml):
-            if etree.QName(elem).localname != "commentExtensible":
-                continue
-            if elem.get(_qn(NS_W16CEX, "durableId")) != durable_id:
-                continue
-            elem.getparent().remove(elem)
-            removed = True
-        if removed:
-            self._save()
-        return removed
+        root = self.xml
+        matches = _XP_COMMENT_EXTENSIBLE_BY_DURABLE_ID(root, did=durable_id)
+        if not matches:
+            return False
+        for elem in matches:
+            root.remove(elem)
+        if self._index is not None:
+            self._index.pop(durable_id, None)
+        self._save()
+        return True
 
 
-class CommentsIdsPart:
+class CommentsIdsPart(_DeferredWrites):
     """Handler for word/commentsIds.xml part."""
 
-    def __init__(self, document: Document) -> None:
+    def __init__(self, document: Document, part: Optional[Part] = None) -> None:
         self._document = document
         self._xml: Optional[etree._Element] = None
+        self._part = part
+        self._blob: Optional[bytes] = None
+        self._index: Optional[dict[str, etree._Element]] = None
 
     def _get_part(self):
-        """Get the commentsIds part from document relationships."""
-        for rel in self._document.part.rels.values():
-            if REL_COMMENTS_IDS in rel.reltype:
-                return rel.target_part
-        return None
+        """Get the commentsIds part from document relationships (cached)."""
+        if self._part is None:
+            self._part = _find_comment_part(self._document.part, REL_COMMENTS_IDS)
+        return self._part
 
     def ensure_exists(self) -> None:
         """Ensure the commentsIds part exists, creating if needed."""
@@ -578,55 +885,48 @@ class CommentsIdsPart:
 
     def _create_part(self) -> None:
         """Create a new commentsIds.xml part."""
-        # Create XML content
-        nsmap = {
-            "mc": NS_MC,
-            "w16cid": NS_W16CID,
-        }
-        root = etree.Element(
-            _qn(NS_W16CID, "commentsIds"),
-            nsmap=nsmap,
-        )
-        root.set(_qn(NS_MC, "Ignorable"), "w16cid")
-
-        xml_content = etree.tostring(
-            root,
-            xml_declaration=True,
-            encoding="UTF-8",
-            standalone="yes",
-        )
-
         # Add part to document
         part = Part(
             PackURI("/word/commentsIds.xml"),
             CT_COMMENTS_IDS,
-            xml_content,
+            _EMPTY_COMMENTS_IDS_XML,
             self._document.part.package,
         )
         self._document.part.relate_to(part, REL_COMMENTS_IDS)
+        self._part = part
 
     @property
     def xml(self) -> etree._Element:
-        """Get the XML root element."""
-        if self._xml is None:
-            part = self._get_part()
-            if part:
-                self._xml = etree.fromstring(part.blob)
-            else:
-                # Return empty element if part doesn't exist
-                self._xml = etree.Element(_qn(NS_W16CID, "commentsIds"))
+        """Get the XML root element (re-parsed if the part blob was replaced)."""
+        part = self._get_part()
+        if part:
+            if self._xml is None or part.blob is not self._blob:
+                self._blob = part.blob
+                self._xml = etree.fromstring(self._blob, _METADATA_PARSER)
+                self._index = None
+        elif self._xml is None:
+            # Return empty element if part doesn't exist
+            self._xml = etree.Element(QN_W16CID_COMMENTS_IDS)
         return self._xml
 
-    def _save(self) -> None:
-        """Save changes back to the part."""
+    def _write(self) -> None:
+        """Serialize changes back to the part."""
         part = self._get_part()
         if part:
-            part._blob = etree.tostring(
-                self.xml,
-                xml_declaration=True,
-                encoding="UTF-8",
-                standalone="yes",
-            )
+            part._blob = _serialize(self.xml)
+            self._blob = part._blob
+
+    def _get_index(self) -> dict[str, etree._Element]:
+        """Return a paraId -> commentId mapping, built on first use."""
+        xml = self.xml
+        if self._index is None:
+            index: dict[str, etree._Element] = {}
+            for elem in xml.iterchildren(QN_W16CID_COMMENT_ID):
+                para_id = elem.get(QN_W16CID_PARAID)
+                if para_id:
+                    index.setdefault(para_id, elem)
+            self._index = index
+        return self._index
 
     def get_durable_ids(self) -> dict[str, str]:
         """
@@ -635,14 +935,25 @@ class CommentsIdsPart:
         Returns:
             Dict mapping para_id to durable_id.
         """
-        result = {}
-        for elem in self.xml:
-            if etree.QName(elem).localname == "commentId":
-                para_id = elem.get(_qn(NS_W16CID, "paraId"))
-                durable_id = elem.get(_qn(NS_W16CID, "durableId"))
+        intern = sys.intern
+        entries = _stream_unparsed(self._get_part(), self._blob, QN_W16CID_COMMENT_ID)
+        if entries is not None:
+            # Large blob not parsed yet: stream it instead of building a tree
+            result = {}
+            for elem in entries:
+                para_id = elem.get(QN_W16CID_PARAID)
+                durable_id = elem.get(QN_W16CID_DURABLE_ID)
                 if para_id and durable_id:
-                    result[para_id] = durable_id
-        return result
+                    result[intern(para_id)] = intern(durable_id)
+            return result
+
+        root = self.xml
+        return dict(
+            zip(
+                map(intern, _XP_CID_PARA_IDS(root)),
+                map(intern, _XP_CID_DURABLE_IDS(root)),
+            )
+        )
 
     def add_comment_id(self, para_id: str, durable_id: str) -> None:
         """
@@ -652,9 +963,13 @@ class CommentsIdsPart:
             para_id: Paragraph ID of the comment.
             durable_id: Durable ID for persistence.
         """
-        elem = etree.SubElement(self.xml, _qn(NS_W16CID, "commentId"))
-        elem.set(_qn(NS_W16CID, "paraId"), para_id)
-        elem.set(_qn(NS_W16CID, "durableId"), durable_id)
+        elem = etree.SubElement(
+            self.xml,
+            QN_W16CID_COMMENT_ID,
+            {QN_W16CID_PARAID: para_id, QN_W16CID_DURABLE_ID: durable_id},
+        )
+        if self._index is not None:
+            self._index.setdefault(para_id, elem)
         self._save()
 
     def remove_comment_id(self, para_id: str) -> Optional[str]:
@@ -667,141 +982,145 @@ class CommentsIdsPart:
         Returns:
             The durableId removed, or None if not found.
         """
+        if para_id not in self._get_index():
+            return None
+        root = self.xml
         removed_durable_id = None
-        removed = False
-        for elem in list(self.xml):
-            if etree.QName(elem).localname != "commentId":
-                continue
-            if elem.get(_qn(NS_W16CID, "paraId")) != para_id:
-                continue
-            removed_durable_id = elem.get(_qn(NS_W16CID, "durableId"))
-            elem.getparent().remove(elem)
-            removed = True
-        if removed:
-            self._save()
+        for elem in _XP_COMMENT_ID_BY_PARA_ID(root, pid=para_id):
+            removed_durable_id = elem.get(QN_W16CID_DURABLE_ID)
+            root.remove(elem)
+        del self._get_index()[para_id]
+        self._save()
         return removed_durable_id
 
 
-class PeoplePart:
+# Person entries in any namespace, matched by lxml's tag filter
+_TAG_ANY_PERSON = "{*}person"
+# Attribute values by local name, for entries outside the w15 namespace
+_XP_ATTR_BY_LOCALNAME = etree.XPath("@*[local-name()=$n]", smart_strings=False)
+
+
+def _attr_by_localname(elem: etree._Element, localname: str) -> Optional[str]:
+    values = _XP_ATTR_BY_LOCALNAME(elem, n=localname)
+    return values[0] if values else None
+
+
+# Person lookups try the w15 qualified name first and fall back to matching by
+# local name, so entries written under another namespace are still read.
+def _person_author(elem: etree._Element) -> Optional[str]:
+    return elem.get(QN_W15_AUTHOR) or _attr_by_localname(elem, "author")
+
+
+def _presence_elem(elem: etree._Element) -> Optional[etree._Element]:
+    presence_elem = elem.find(QN_W15_PRESENCE_INFO)
+    if presence_elem is None:
+        presence_elem = next(elem.iterchildren("{*}presenceInfo"), None)
+    return presence_elem
+
+
+def _person_info(elem: etree._Element) -> PersonInfo:
+    author = _person_author(elem) or ""
+    presence_elem = _presence_elem(elem)
+    provider_id = user_id = None
+    if presence_elem is not None:
+        provider_id = presence_elem.get(QN_W15_PROVIDER_ID) or _attr_by_localname(
+            presence_elem, "providerId"
+        )
+        user_id = presence_elem.get(QN_W15_USER_ID) or _attr_by_localname(
+            presence_elem, "userId"
+        )
+    return PersonInfo(author=author, provider_id=provider_id, user_id=user_id)
+
+
+def read_people(root: etree._Element) -> list[PersonInfo]:
+    """
+    Read the person entries of a people.xml root element.
+
+    Entries and their attributes are matched by local name when they are not
+    in the w15 namespace. An entry without an author gets an empty one.
+    """
+    return [_person_info(elem) for elem in root.iterchildren(_TAG_ANY_PERSON)]
+
+
+class PeoplePart(_DeferredWrites):
     """Handler for word/people.xml part."""
 
-    def __init__(self, document: Document) -> None:
+    def __init__(self, document: Document, part: Optional[Part] = None) -> None:
         self._document = document
         self._xml: Optional[etree._Element] = None
+        self._part = part
+        self._blob: Optional[bytes] = None
+        self._index: Optional[dict[str, etree._Element]] = None
 
     def _get_part(self):
-        """Get the people part from document relationships."""
-        for rel in self._document.part.rels.values():
-            if REL_PEOPLE in rel.reltype:
-                return rel.target_part
-        return None
+        """Get the people part from document relationships (cached)."""
+        if self._part is None:
+            self._part = _find_comment_part(self._document.part, REL_PEOPLE)
+        return self._part
 
     def ensure_exists(self) -> None:
         """Ensure the people part exists, creating if needed."""
         if self._get_part() is None:
             self._create_part()
-            self._xml = None
 
     def _create_part(self) -> None:
         """Create a new people.xml part."""
-        nsmap = {
-            "mc": NS_MC,
-            "w": NS_W,
-            "w14": NS_W14,
-            "w15": NS_W15,
-            "wp14": NS_WP14,
-        }
-        root = etree.Element(
-            _qn(NS_W15, "people"),
-            nsmap=nsmap,
-        )
-        root.set(_qn(NS_MC, "Ignorable"), "w14 w15 wp14")
-
-        xml_content = etree.tostring(
-            root,
-            xml_declaration=True,
-            encoding="UTF-8",
-            standalone="yes",
-        )
-
         part = Part(
             PackURI("/word/people.xml"),
             CT_PEOPLE,
-            xml_content,
+            _EMPTY_PEOPLE_XML,
             self._document.part.package,
         )
         self._document.part.relate_to(part, REL_PEOPLE)
+        self._part = part
 
     @property
     def xml(self) -> etree._Element:
-        """Get the XML root element."""
-        if self._xml is None:
-            part = self._get_part()
-            if part:
-                self._xml = etree.fromstring(part.blob)
-            else:
-                self._xml = etree.Element(_qn(NS_W15, "people"))
-        return self._xml
+        """Get the XML root element.
 
-    def _save(self) -> None:
-        """Save changes back to the part."""
+        The parsed tree is cached and re-parsed only if another handler has
+        replaced the part blob since it was read.
+        """
         part = self._get_part()
         if part:
-            part._blob = etree.tostring(
-                self.xml,
-                xml_declaration=True,
-                encoding="UTF-8",
-                standalone="yes",
-            )
-
-    @staticmethod
-    def _attr_by_localname(elem: etree._Element, localname: str) -> Optional[str]:
-        for attr, value in elem.attrib.items():
-            try:
-                if etree.QName(attr).localname == localname:
-                    return value
-            except (ValueError, TypeError):
-                if attr == localname:
-                    return value
-        return None
-
-    @staticmethod
-    def _find_child_by_localname(
-        elem: etree._Element, localname: str
-    ) -> Optional[etree._Element]:
-        for child in elem:
-            if etree.QName(child).localname == localname:
-                return child
-        return None
+            if self._xml is None or part.blob is not self._blob:
+                self._blob = part.blob
+                self._xml = etree.fromstring(self._blob, _METADATA_PARSER)
+                self._index = None
+        elif self._xml is None:
+            # Return empty element if part doesn't exist
+            self._xml = etree.Element(QN_W15_PEOPLE)
+        return self._xml
 
-    def _person_info_from_elem(self, elem: etree._Element) -> PersonInfo:
-        author = self._attr_by_localname(elem, "author") or ""
-        presence_elem = self._find_child_by_localname(elem, "presenceInfo")
-        provider_id = user_id = None
-        if presence_elem is not None:
-            provider_id = self._attr_by_localname(presence_elem, "providerId")
-            user_id = self._attr_by_localname(presence_elem, "userId")
-        return PersonInfo(author=author, provider_id=provider_id, user_id=user_id)
+    def _write(self) -> None:
+        """Serialize changes back to the part."""
+        part = self._get_part()
+        if part:
+            part._blob = _serialize(self.xml)
+            self._blob = part._blob
 
     def get_people(self) -> list[PersonInfo]:
         """List people entries in people.xml."""
         if self._get_part() is None:
             return []
-        people: list[PersonInfo] = []
-        for elem in self.xml:
-            if etree.QName(elem).localname == "person":
-                people.append(self._person_info_from_elem(elem))
-        return people
+        return read_people(self.xml)
+
+    def _get_index(self) -> dict[str, etree._Element]:
+        """Return an author -> person element mapping, built on first use."""
+        xml = self.xml
+        if self._index is None:
+            index: dict[str, etree._Element] = {}
+            for elem in xml.iterchildren(_TAG_ANY_PERSON):
+                author = _person_author(elem)
+                if author:
+                    index.setdefault(author, elem)
+            self._index = index
+        return self._index
 
     def _find_person_elem(self, author: str) -> Optional[etree._Element]:
         if self._get_part() is None:
             return None
-        for elem in self.xml:
-            if etree.QName(elem).localname != "person":
-                continue
-            if self._attr_by_localname(elem, "author") == author:
-                return elem
-        return None
+        return self._get_index().get(author)
 
     def get_person(self, author: str) -> PersonInfo:
         """Return a person entry by author name."""
@@ -810,7 +1129,7 @@ class PeoplePart:
         elem = self._find_person_elem(author)
         if elem is None:
             raise KeyError(f"person '{author}' not found")
-        return self._person_info_from_elem(elem)
+        return _person_info(elem)
 
     @staticmethod
     def _normalize_presence(presence: dict[str, str]) -> tuple[str, str]:
@@ -828,21 +1147,36 @@ class PeoplePart:
             raise ValueError("author must be non-empty")
 
         person_elem = self._find_person_elem(author)
+        created = person_elem is None
         if person_elem is None:
             self.ensure_exists()
-            person_elem = etree.SubElement(self.xml, _qn(NS_W15, "person"))
-            person_elem.set(_qn(NS_W15, "author"), author)
+            person_elem = etree.SubElement(self.xml, QN_W15_PERSON, {QN_W15_AUTHOR: author})
+            self._get_index()[author] = person_elem
 
+        # Build the result from known values; only an untouched existing
+        # entry needs to be read back for its presence metadata.
+        changed = created
         if presence:
             provider_id, user_id = self._normalize_presence(presence)
-            presence_elem = self._find_child_by_localname(person_elem, "presenceInfo")
+            presence_elem = _presence_elem(person_elem)
             if presence_elem is None:
-                presence_elem = etree.SubElement(person_elem, _qn(NS_W15, "presenceInfo"))
-            presence_elem.set(_qn(NS_W15, "providerId"), provider_id)
-            presence_elem.set(_qn(NS_W15, "userId"), user_id)
-
-        self._save()
-        return self._person_info_from_elem(person_elem)
+                presence_elem = etree.SubElement(person_elem, QN_W15_PRESENCE_INFO)
+            if (
+                presence_elem.get(QN_W15_PROVIDER_ID) != provider_id
+                or presence_elem.get(QN_W15_USER_ID) != user_id
+            ):
+                presence_elem.set(QN_W15_PROVIDER_ID, provider_id)
+                presence_elem.set(QN_W15_USER_ID, user_id)
+                changed = True
+            info = PersonInfo(author=author, provider_id=provider_id, user_id=user_id)
+        elif created:
+            info = PersonInfo(author=author)
+        else:
+            info = _person_info(person_elem)
+
+        if changed:
+            self._save()
+        return info
 
     def merge_from(
         self, source: "PeoplePart", include_presence: bool = False
@@ -855,21 +1189,103 @@ class PeoplePart:
         if source._get_part() is None:
             return []
 
-        existing_authors = {person.author for person in self.get_people()}
-        added: list[PersonInfo] = []
-
+        # The author index already holds every existing author
+        existing = self._get_index() if self._get_part() is not None else {}
+        new_authors: set[str] = set()
+        to_add: list[PersonInfo] = []
         for person in source.get_people():
-            if not person.author or person.author in existing_authors:
-                continue
+            author = person.author
+            if author and author not in existing and author not in new_authors:
+                to_add.append(person)
+                new_authors.add(author)
+        if not to_add:
+            return []
 
-            presence = None
+        # Create all new entries in one pass and serialize people.xml once
+        self.ensure_exists()
+        root = self.xml
+        index = self._get_index()
+        added: list[PersonInfo] = []
+        for person in to_add:
+            person_elem = etree.SubElement(root, QN_W15_PERSON, {QN_W15_AUTHOR: person.author})
+            index[person.author] = person_elem
             if include_presence and person.provider_id and person.user_id:
-                presence = {
-                    "provider_id": person.provider_id,
-                    "user_id": person.user_id,
-                }
-
-            added.append(self.ensure_person(person.author, presence))
-            existing_authors.add(person.author)
+                etree.SubElement(
+                    person_elem,
+                    QN_W15_PRESENCE_INFO,
+                    {QN_W15_PROVIDER_ID: person.provider_id, QN_W15_USER_ID: person.user_id},
+                )
+                added.append(person)
+            else:
+                added.append(PersonInfo(author=person.author))
 
+        self._save()
         return added
+
+
+class _WeakDocument:
+    """Stand-in for a Document that holds its part weakly.
+
+    Handlers only use ``document.part``; the shared handlers go through this
+    so that the context registry does not keep the document alive.
+    """
+
+    __slots__ = ("_part_ref",)
+
+    def __init__(self, part: Part) -> None:
+        self._part_ref = weakref.ref(part)
+
+    @property
+    def part(self) -> Part:
+        part = self._part_ref()
+        if part is None:
+            raise ReferenceError("the document has been released")
+        return part
+
+
+class _CommentsContext:
+    """Comment and people part handlers shared across one document.
+
+    Also holds the lookups CommentManager derives from the parts, each with
+    the part revisions it was read at, so every manager on the document
+    reuses and invalidates the same copies.
+    """
+
+    def __init__(self, doc_part: Part) -> None:
+        document = cast("Document", _WeakDocument(doc_part))
+        found = _scan_comment_parts(doc_part)
+        self.comments = CommentsPart(document, found.get(REL_COMMENTS))
+        self.extended = CommentsExtendedPart(document, found.get(REL_COMMENTS_EXT))
+        self.ids = CommentsIdsPart(document, found.get(REL_COMMENTS_IDS))
+        self.extensible = CommentsExtensiblePart(document, found.get(REL_COMMENTS_EXTENSIBLE))
+        self.people = PeoplePart(document, found.get(REL_PEOPLE))
+        self.threading: dict[str, CommentExInfo] = {}
+        self.threading_key: Optional[tuple[object, int]] = None
+        self.durable_ids: dict[str, str] = {}
+        self.durable_ids_key: Optional[tuple[object, int]] = None
+        self.id_index: Optional[dict[str, str]] = None
+        self.comment_ids_by_para_id: dict[str, str] = {}
+        self.id_index_key: Optional[tuple[tuple[object, int], ...]] = None
+
+    @contextmanager
+    def batch(self) -> Iterator[_CommentsContext]:
+        """Hold back writes to every part until the outermost batch exits."""
+        with ExitStack() as stack:
+            for handler in (self.comments, self.extended, self.ids, self.extensible, self.people):
+                stack.enter_context(handler.batch())
+            yield self
+
+
+# Contexts by document part. Nothing in a context refers to the document
+# strongly, so an entry lives exactly as long as its document part.
+_CONTEXTS: weakref.WeakKeyDictionary[Part, _CommentsContext] = weakref.WeakKeyDictionary()
+
+
+def _comments_context(document: Document) -> _CommentsContext:
+    """Return the document's shared handler context, creating it on first use."""
+    doc_part = document.part
+    context = _CONTEXTS.get(doc_part)
+    if context is None:
+        context = _CommentsContext(doc_part)
+        _CONTEXTS[doc_part] = context
+    return context
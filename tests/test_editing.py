@@ -1,5 +1,6 @@
 """Tests for editing comment anchors and lifecycle operations."""
 
+import pytest
 from docx import Document
 
 from docx_comments import CommentManager, PersonInfo
@@ -33,6 +34,78 @@ class TestCommentEditing:
         assert len(comments) == 1
         assert not comments[0].is_resolved
 
+    def test_resolve_deleted_comment_raises(self):
+        """Comment lookups reflect deletions made through the manager."""
+        doc = Document()
+        para = doc.add_paragraph("Test paragraph")
+        mgr = CommentManager(doc)
+
+        first_id = mgr.add_comment(para, "First", author_obj("Author1"))
+        second_id = mgr.add_comment(para, "Second", author_obj("Author2"))
+        mgr.resolve_comment(first_id)
+
+        mgr.delete_comment(first_id)
+
+        with pytest.raises(ValueError):
+            mgr.resolve_comment(first_id)
+        mgr.resolve_comment(second_id)
+        comments = list(mgr.list_comments())
+        assert [c.comment_id for c in comments] == [second_id]
+        assert comments[0].is_resolved
+
+    def test_resolve_after_external_metadata_write(self):
+        """Cached commentsExtended lookups follow writes by other handlers."""
+        doc = Document()
+        para = doc.add_paragraph("Test paragraph")
+        mgr = CommentManager(doc)
+
+        comment_id = mgr.add_comment(para, "Needs work", author_obj("Reviewer"))
+        para_id = next(mgr.list_comments()).para_id
+        mgr.resolve_comment(comment_id)
+
+        other = CommentsExtendedPart(doc)
+        other.remove_comment_ex(para_id)
+        other.add_comment_ex(para_id)
+
+        mgr.resolve_comment(comment_id)
+        assert CommentsExtendedPart(doc).get_threading_info()[para_id].done
+
+    def test_comment_lookup_sees_comments_added_by_another_manager(self):
+        """A manager's comment id index picks up comments added elsewhere."""
+        doc = Document()
+        para = doc.add_paragraph("Test paragraph")
+        first = CommentManager(doc)
+        second = CommentManager(doc)
+        first.resolve_comment(first.add_comment(para, "First", author_obj("Author1")))
+
+        added_id = second.add_comment(para, "Second", author_obj("Author2"))
+
+        first.resolve_comment(added_id)
+        assert all(c.is_resolved for c in second.list_comments())
+
+    def test_comment_lookup_sees_direct_comments_part_removal(self):
+        """Removing a loaded comment through CommentsPart invalidates the index."""
+        from io import BytesIO
+
+        from docx_comments.xml_parts import CommentsPart
+
+        doc = Document()
+        para = doc.add_paragraph("Test paragraph")
+        CommentManager(doc).add_comment(para, "Saved", author_obj("Author"))
+        buffer = BytesIO()
+        doc.save(buffer)
+        buffer.seek(0)
+
+        loaded = Document(buffer)
+        mgr = CommentManager(loaded)
+        comment_id = next(mgr.list_comments()).comment_id
+        mgr.resolve_comment(comment_id)
+
+        assert CommentsPart(loaded).remove_comment(comment_id)
+
+        with pytest.raises(ValueError):
+            mgr.resolve_comment(comment_id)
+
     def test_delete_comment_detaches_replies(self):
         """Deleting a root comment detaches remaining replies."""
         doc = Document()
@@ -149,6 +222,16 @@ class TestCommentEditing:
         assert anchored_para is not None
         assert anchored_para._element is para2._element
 
+    def test_move_missing_comment_raises(self):
+        """Moving an unknown comment ID raises ValueError."""
+        doc = Document()
+        para = doc.add_paragraph("Paragraph one")
+        mgr = CommentManager(doc)
+        mgr.add_comment(para, "Existing", author_obj("Author1"))
+
+        with pytest.raises(ValueError):
+            mgr.move_comment("999999", para)
+
     def test_move_thread_moves_replies(self):
         """Moving a thread re-anchors replies at the new location."""
         doc = Document()
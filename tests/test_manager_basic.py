@@ -1,5 +1,7 @@
 """Basic CommentManager behavior tests."""
 
+from io import BytesIO
+
 from docx import Document
 
 import pytest
@@ -26,10 +28,9 @@ class TestCommentManagerBasic:
         doc = Document()
         doc.add_paragraph("Test paragraph")
         mgr = CommentManager(doc)
-        comments = list(mgr.list_comments())
-        assert len(comments) == 0
+        assert next(mgr.list_comments(), None) is None
 
-    def test_add_comment(self, tmp_path):
+    def test_add_comment(self):
         """Test adding a comment to a paragraph."""
         doc = Document()
         para = doc.add_paragraph("This is test text to comment on.")
@@ -53,11 +54,12 @@ class TestCommentManagerBasic:
         assert comments[0].initials == "TA"
 
         # Save and reload
-        output_path = tmp_path / "test_output.docx"
-        doc.save(str(output_path))
+        buffer = BytesIO()
+        doc.save(buffer)
+        buffer.seek(0)
 
         # Reload and verify
-        doc2 = Document(str(output_path))
+        doc2 = Document(buffer)
         mgr2 = CommentManager(doc2)
         comments2 = list(mgr2.list_comments())
         assert len(comments2) == 1
@@ -95,15 +97,13 @@ class TestCommentManagerBasic:
         )
 
         # Initially not resolved
-        comments = list(mgr.list_comments())
-        assert not comments[0].is_resolved
+        assert not next(mgr.list_comments()).is_resolved
 
         # Resolve
         mgr.resolve_comment(comment_id)
 
         # Verify resolved
-        comments = list(mgr.list_comments())
-        assert comments[0].is_resolved
+        assert next(mgr.list_comments()).is_resolved
 
     def test_get_comment_threads(self):
         """Test getting comment threads."""
@@ -127,3 +127,34 @@ class TestCommentManagerBasic:
         thread_with_replies = next(t for t in threads if t.reply_count > 0)
         assert thread_with_replies.root.text == "Comment 1"
         assert thread_with_replies.reply_count == 2
+
+    def test_parse_comment_dates(self):
+        """Test Word-style and offset comment dates parse to UTC."""
+        from datetime import datetime, timezone
+
+        from docx_comments.manager import _parse_comment_date
+
+        expected = datetime(2024, 3, 5, 14, 7, 9, tzinfo=timezone.utc)
+        assert _parse_comment_date("2024-03-05T14:07:09Z") == expected
+        assert _parse_comment_date("2024-03-05T15:07:09+01:00") == expected
+        assert _parse_comment_date("2024-03-05T14:07:09") == expected
+        assert _parse_comment_date("not-a-dateZ") is None
+        assert _parse_comment_date(None) is None
+
+    def test_add_comment_escapes_markup(self):
+        """Test comment text and author with XML special characters."""
+        doc = Document()
+        para = doc.add_paragraph("Test text")
+        mgr = CommentManager(doc)
+
+        text = 'Use <b> & "quotes"\nnext line'
+        mgr.add_comment(para, text, author_obj('O\'Neil & "Co"'), initials="O&C")
+
+        comment = next(iter(mgr.list_comments()))
+        assert comment.text == text
+        assert comment.author == 'O\'Neil & "Co"'
+        assert comment.initials == "O&C"
+
+        with pytest.raises(ValueError):
+            mgr.add_comment(para, "bad\x01text", author_obj("Author"))
+        assert len(list(mgr.list_comments())) == 1
@@ -1,6 +1,10 @@
 """Tests for comment data models."""
 
-from docx_comments.models import CommentInfo, CommentThread
+from dataclasses import FrozenInstanceError
+
+import pytest
+
+from docx_comments.models import CommentExInfo, CommentInfo, CommentThread
 
 
 class TestCommentInfo:
@@ -26,6 +30,17 @@ class TestCommentInfo:
         assert reply.is_reply
 
 
+class TestCommentExInfo:
+    """Tests for CommentExInfo model."""
+
+    def test_is_immutable(self):
+        """Threading records cannot be changed after construction."""
+        info = CommentExInfo("ABC", done=True)
+        with pytest.raises(FrozenInstanceError):
+            info.done = False
+        assert info == CommentExInfo(parent_para_id="ABC", done=True)
+
+
 class TestCommentThread:
     """Tests for CommentThread model."""
 
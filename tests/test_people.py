@@ -12,6 +12,22 @@ def author_obj(name: str) -> PersonInfo:
     return PersonInfo(author=name)
 
 
+@pytest.fixture
+def people_writes(monkeypatch):
+    """Record the root tag of every part serialized by the handlers."""
+    import docx_comments.xml_parts as xml_parts
+
+    writes = []
+    real_serialize = xml_parts._serialize
+
+    def counting_serialize(root):
+        writes.append(root.tag)
+        return real_serialize(root)
+
+    monkeypatch.setattr(xml_parts, "_serialize", counting_serialize)
+    return writes
+
+
 class TestPeopleXml:
     """Tests for people.xml integration."""
 
@@ -64,6 +80,22 @@ class TestPeopleXml:
         assert isinstance(person, PersonInfo)
         assert person.author == "Alice"
 
+    def test_read_people_matches_any_namespace(self):
+        """read_people reads entries written outside the w15 namespace."""
+        from lxml import etree
+
+        from docx_comments.xml_parts import read_people
+
+        xml = etree.fromstring(
+            b'<p:people xmlns:p="urn:example">'
+            b'<p:person p:author="Alice"><p:presenceInfo p:providerId="AD" p:userId="a"/>'
+            b"</p:person><p:person/></p:people>"
+        )
+        assert read_people(xml) == [
+            PersonInfo(author="Alice", provider_id="AD", user_id="a"),
+            PersonInfo(author=""),
+        ]
+
     def test_get_default_author_person_from_docx(self, tmp_path):
         """Resolve default author from a DOCX source."""
         source_doc = Document()
@@ -181,6 +213,37 @@ class TestPeopleXml:
         assert alice_with_presence.provider_id == "provider"
         assert alice_with_presence.user_id == "user"
 
+    def test_merge_people_writes_part_once(self, people_writes):
+        """Merging several people serializes people.xml once."""
+        import docx_comments.xml_parts as xml_parts
+
+        source_doc = Document()
+        source_mgr = CommentManager(source_doc)
+        for author in ("Alice", "Bob", "Carol"):
+            source_mgr.ensure_person(author)
+
+        target_doc = Document()
+        CommentManager(target_doc).ensure_person("Dave")
+
+        people_writes.clear()
+        added = xml_parts.PeoplePart(target_doc).merge_from(xml_parts.PeoplePart(source_doc))
+
+        assert [person.author for person in added] == ["Alice", "Bob", "Carol"]
+        assert len(people_writes) == 1
+
+    def test_ensure_existing_person_skips_write(self, people_writes):
+        """Re-ensuring an unchanged person should not reserialize people.xml."""
+        doc = Document()
+        mgr = CommentManager(doc)
+        mgr.ensure_person("Alice", presence={"provider_id": "AD", "user_id": "alice@example.com"})
+
+        people_writes.clear()
+        mgr.ensure_person("Alice")
+        mgr.ensure_person("Alice", presence={"provider_id": "AD", "user_id": "alice@example.com"})
+
+        assert people_writes == []
+        assert mgr.get_person("Alice").user_id == "alice@example.com"
+
     def test_add_comment_with_author_personinfo(self):
         """Author can be provided as PersonInfo."""
         doc = Document()
@@ -12,7 +12,7 @@ def author_obj(name: str) -> PersonInfo:
 class TestCommentThreads:
     """Tests for threaded comment behavior."""
 
-    def test_reply_to_comment(self, tmp_path):
+    def test_reply_to_comment(self):
         """Test replying to a comment."""
         doc = Document()
         para = doc.add_paragraph("Text to comment on.")
@@ -61,6 +61,22 @@ class TestCommentThreads:
         assert threads[0].root.comment_id == root_id
         assert threads[0].reply_count == 2
 
+    def test_replies_keep_para_id_lookup_current(self):
+        """Replies extend the cached para_id -> comment_id map instead of rebuilding it."""
+        doc = Document()
+        para = doc.add_paragraph("Threaded comment text.")
+        mgr = CommentManager(doc)
+
+        root_id = mgr.add_comment(para, "Root comment", author_obj("Author1"))
+        by_para_id = mgr._get_comment_ids_by_para_id()
+        reply1_id = mgr.reply_to_comment(root_id, "Reply 1", author_obj("Author2"))
+        reply2_id = mgr.reply_to_comment(reply1_id, "Reply 2", author_obj("Author3"))
+
+        assert mgr._get_comment_ids_by_para_id() is by_para_id
+        expected = {c.para_id: c.comment_id for c in mgr.list_comments()}
+        assert by_para_id == expected
+        assert set(by_para_id.values()) == {root_id, reply1_id, reply2_id}
+
     def test_reply_to_comment_in_table(self):
         """Test replying to a comment anchored in a table."""
         doc = Document()
@@ -127,3 +143,100 @@ class TestCommentThreads:
         reply2 = next(c for c in comments if c.text == "Body reply 2")
         root = next(c for c in comments if c.text == "Root body")
         assert reply2.parent_para_id == root.para_id
+
+    def test_batch_defers_part_writes(self, tmp_path):
+        """Batched changes are written to the package once the batch exits."""
+        doc = Document()
+        para = doc.add_paragraph("Text to comment on.")
+        mgr = CommentManager(doc)
+        ext_part = mgr._ext_part._get_part()
+        blob_before = ext_part.blob
+
+        with mgr.batch():
+            root_id = mgr.add_comment(para, "Root comment", author_obj("Author1"))
+            with mgr.batch():
+                mgr.reply_to_comment(root_id, "Reply comment", author_obj("Author2"))
+            assert ext_part.blob is blob_before
+            mgr.resolve_comment(root_id)
+            assert len(mgr.get_comment_threads()[0].replies) == 1
+
+        assert ext_part.blob is not blob_before
+
+        output_path = tmp_path / "batch_roundtrip.docx"
+        doc.save(str(output_path))
+
+        threads = CommentManager(Document(str(output_path))).get_comment_threads()
+        assert len(threads) == 1
+        assert threads[0].is_resolved
+        assert threads[0].reply_count == 1
+
+    def test_threading_arrays_match_threading_info(self):
+        """Parallel threading arrays agree with the per-comment mapping."""
+        from docx_comments.xml_parts import CommentsExtendedPart
+
+        doc = Document()
+        para = doc.add_paragraph("Text to comment on.")
+        mgr = CommentManager(doc)
+        root_id = mgr.add_comment(para, "Root comment", author_obj("Author1"))
+        mgr.reply_to_comment(root_id, "Reply comment", author_obj("Author2"))
+        mgr.resolve_comment(root_id)
+
+        ext_part = CommentsExtendedPart(doc)
+        para_ids, parents, done = ext_part.get_threading_arrays()
+        info = ext_part.get_threading_info()
+
+        assert para_ids == list(info)
+        assert parents == [info[p].parent_para_id for p in para_ids]
+        assert list(done) == [1, 0]
+        assert parents[0] is None and parents[1] == para_ids[0]
+
+    def test_add_comments_ex_bulk_matches_single_adds(self):
+        """Bulk commentEx inserts place entries like repeated single adds."""
+        from docx_comments.xml_parts import CommentsExtendedPart
+
+        entries = [("0000000A", None, False), ("0000000B", "0000000A", True)]
+        single_doc, bulk_doc = Document(), Document()
+        CommentManager(single_doc)
+        CommentManager(bulk_doc)
+
+        single = CommentsExtendedPart(single_doc)
+        for para_id, parent_para_id, done in entries:
+            single.add_comment_ex(para_id, parent_para_id, done)
+        CommentsExtendedPart(bulk_doc).add_comments_ex_bulk(entries)
+
+        assert CommentsExtendedPart(bulk_doc).get_threading_arrays() == (
+            CommentsExtendedPart(single_doc).get_threading_arrays()
+        )
+
+    def test_cached_metadata_sees_direct_handler_writes(self):
+        """Threading read by a manager reflects writes made through another handler."""
+        from docx_comments.xml_parts import CommentsExtendedPart
+
+        doc = Document()
+        para = doc.add_paragraph("Text to comment on.")
+        mgr = CommentManager(doc)
+        mgr.add_comment(para, "Root comment", author_obj("Author1"))
+        comment = next(mgr.list_comments())
+        assert not comment.is_resolved
+
+        CommentsExtendedPart(doc).set_done(comment.para_id, True)
+
+        assert next(mgr.list_comments()).is_resolved
+
+    def test_managers_on_one_document_see_each_others_changes(self):
+        """Resolutions and replies made by one manager are seen by another."""
+        doc = Document()
+        para = doc.add_paragraph("Text to comment on.")
+        first = CommentManager(doc)
+        second = CommentManager(doc)
+        root_id = first.add_comment(para, "Root comment", author_obj("Author1"))
+        assert not next(second.list_comments()).is_resolved
+
+        first.resolve_comment(root_id)
+        assert next(second.list_comments()).is_resolved
+
+        first.reply_to_comment(root_id, "Reply comment", author_obj("Author2"))
+        threads = second.get_comment_threads()
+        assert len(threads) == 1
+        assert threads[0].root.comment_id == root_id
+        assert threads[0].replies[0].parent_para_id == threads[0].root.para_id
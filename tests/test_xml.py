@@ -1,64 +1,94 @@
 """Word Online compatibility and XML structure tests."""
 
+from io import BytesIO
+from zipfile import ZipFile
+
+import pytest
 from docx import Document
+from lxml import etree
 
 from docx_comments import CommentManager, PersonInfo
 
+_NS = {
+    "w": "http://schemas.openxmlformats.org/wordprocessingml/2006/main",
+    "w15": "http://schemas.microsoft.com/office/word/2012/wordml",
+}
+_XP_COMMENT = etree.XPath("w:comment", namespaces=_NS)
+_XP_COMMENT_EX = etree.XPath("w15:commentEx", namespaces=_NS)
+_XP_RANGE_START = etree.XPath("//w:commentRangeStart", namespaces=_NS)
+_XP_RANGE_START_BY_ID = etree.XPath("//w:commentRangeStart[@w:id=$cid]", namespaces=_NS)
+_XP_RANGE_END = etree.XPath("//w:commentRangeEnd", namespaces=_NS)
+_XP_REFERENCE = etree.XPath("//w:commentReference", namespaces=_NS)
+
 
 def author_obj(name: str) -> PersonInfo:
     return PersonInfo(author=name)
 
 
+def _load_parts(doc) -> dict[str, bytes]:
+    """Save a document to memory and read every package part in one pass."""
+    buffer = BytesIO()
+    doc.save(buffer)
+    with ZipFile(buffer, "r") as zf:
+        return {name: zf.read(name) for name in zf.namelist()}
+
+
+@pytest.fixture(scope="module")
+def single_comment_docx():
+    """Saved document with one comment, shared by the read-only tests."""
+    doc = Document()
+    para = doc.add_paragraph("This is test text to comment on.")
+    mgr = CommentManager(doc)
+    comment_id = mgr.add_comment(
+        para, "Review this section", author_obj("Reviewer"), initials="R"
+    )
+    return _load_parts(doc), comment_id
+
+
+@pytest.fixture(scope="module")
+def reply_thread_docx():
+    """Saved document with a root comment and one reply."""
+    doc = Document()
+    para = doc.add_paragraph("This is test text to comment on.")
+    mgr = CommentManager(doc)
+    root_id = mgr.add_comment(para, "Root comment", author_obj("Author1"))
+    mgr.reply_to_comment(root_id, "Reply comment", author_obj("Author2"))
+    return _load_parts(doc), root_id
+
+
+@pytest.fixture(scope="module")
+def resolved_comment_docx():
+    """Saved document with a single resolved comment."""
+    doc = Document()
+    para = doc.add_paragraph("Test text")
+    mgr = CommentManager(doc)
+    comment_id = mgr.add_comment(para, "Comment to resolve", author_obj("Author"))
+    mgr.resolve_comment(comment_id)
+    return _load_parts(doc), comment_id
+
+
 class TestWordOnlineCompatibility:
     """Tests for Word Online compatibility by validating XML structure."""
 
-    def test_xml_parts_created(self, tmp_path):
+    def test_xml_parts_created(self, single_comment_docx):
         """Test that all required XML parts are created."""
-        from zipfile import ZipFile
-
-        doc = Document()
-        para = doc.add_paragraph("Test text")
-        mgr = CommentManager(doc)
-
-        # Add a comment
-        mgr.add_comment(para, "Test comment", author_obj("Author"))
+        parts, _ = single_comment_docx
 
-        # Save document
-        output_path = tmp_path / "test_parts.docx"
-        doc.save(str(output_path))
+        assert "word/comments.xml" in parts
+        assert "word/commentsExtended.xml" in parts
+        assert "word/commentsIds.xml" in parts
 
-        # Check ZIP contents
-        with ZipFile(str(output_path), "r") as zf:
-            names = zf.namelist()
-            assert "word/comments.xml" in names
-            assert "word/commentsExtended.xml" in names
-            assert "word/commentsIds.xml" in names
-
-    def test_comments_xml_structure(self, tmp_path):
+    def test_comments_xml_structure(self, single_comment_docx):
         """Test comments.xml has correct structure."""
-        from lxml import etree
-        from zipfile import ZipFile
-
-        doc = Document()
-        para = doc.add_paragraph("Test text")
-        mgr = CommentManager(doc)
-
-        comment_id = mgr.add_comment(
-            para, "Review this section", author_obj("Reviewer"), initials="R"
-        )
-
-        output_path = tmp_path / "test_comments_xml.docx"
-        doc.save(str(output_path))
-
-        with ZipFile(str(output_path), "r") as zf:
-            xml = etree.fromstring(zf.read("word/comments.xml"))
+        parts, comment_id = single_comment_docx
+        xml = etree.fromstring(parts["word/comments.xml"])
 
         # Check root element
         assert xml.tag.endswith("}comments")
 
         # Find comment element
         ns_w = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
-        comments = xml.findall(f"{{{ns_w}}}comment")
+        comments = _XP_COMMENT(xml)
         assert len(comments) == 1
 
         comment = comments[0]
@@ -66,129 +96,78 @@ class TestWordOnlineCompatibility:
         assert comment.get(f"{{{ns_w}}}initials") == "R"
         assert comment.get(f"{{{ns_w}}}id") == comment_id
 
-    def test_threading_xml_structure(self, tmp_path):
+    def test_threading_xml_structure(self, reply_thread_docx):
         """Test commentsExtended.xml has correct threading structure."""
-        from lxml import etree
-        from zipfile import ZipFile
-
-        doc = Document()
-        para = doc.add_paragraph("Test text")
-        mgr = CommentManager(doc)
-
-        # Add root comment and reply
-        root_id = mgr.add_comment(para, "Root comment", author_obj("Author1"))
-        mgr.reply_to_comment(root_id, "Reply comment", author_obj("Author2"))
-
-        output_path = tmp_path / "test_threading.docx"
-        doc.save(str(output_path))
-
-        with ZipFile(str(output_path), "r") as zf:
-            xml = etree.fromstring(zf.read("word/commentsExtended.xml"))
+        parts, _ = reply_thread_docx
+        xml = etree.fromstring(parts["word/commentsExtended.xml"])
 
         # Check root element
         assert xml.tag.endswith("}commentsEx")
 
-        # Find commentEx elements
         ns_w15 = "http://schemas.microsoft.com/office/word/2012/wordml"
-        comment_exs = xml.findall(f"{{{ns_w15}}}commentEx")
-        assert len(comment_exs) == 2
+        qn_para_id = f"{{{ns_w15}}}paraId"
+        qn_parent = f"{{{ns_w15}}}paraIdParent"
 
-        # Check that reply has parent link
+        # Collect paraIds and parent links in one pass over commentEx elements
         para_ids = set()
         parent_links = {}
-        for ce in comment_exs:
-            para_id = ce.get(f"{{{ns_w15}}}paraId")
-            parent = ce.get(f"{{{ns_w15}}}paraIdParent")
+        count = 0
+        for ce in _XP_COMMENT_EX(xml):
+            count += 1
+            para_id = ce.get(qn_para_id)
+            parent = ce.get(qn_parent)
             para_ids.add(para_id)
             if parent:
                 parent_links[para_id] = parent
 
+        assert count == 2
         # One comment should have a parent link
         assert len(parent_links) == 1
         # The parent should exist
         assert list(parent_links.values())[0] in para_ids
 
-    def test_resolved_status_in_xml(self, tmp_path):
+    def test_resolved_status_in_xml(self, resolved_comment_docx):
         """Test that resolved status is correctly saved in XML."""
-        from lxml import etree
-        from zipfile import ZipFile
-
-        doc = Document()
-        para = doc.add_paragraph("Test text")
-        mgr = CommentManager(doc)
-
-        comment_id = mgr.add_comment(para, "Comment to resolve", author_obj("Author"))
-        mgr.resolve_comment(comment_id)
-
-        output_path = tmp_path / "test_resolved.docx"
-        doc.save(str(output_path))
-
-        with ZipFile(str(output_path), "r") as zf:
-            xml = etree.fromstring(zf.read("word/commentsExtended.xml"))
+        parts, _ = resolved_comment_docx
+        xml = etree.fromstring(parts["word/commentsExtended.xml"])
 
         ns_w15 = "http://schemas.microsoft.com/office/word/2012/wordml"
-        comment_exs = xml.findall(f"{{{ns_w15}}}commentEx")
+        comment_exs = _XP_COMMENT_EX(xml)
         assert len(comment_exs) == 1
         assert comment_exs[0].get(f"{{{ns_w15}}}done") == "1"
 
-    def test_document_xml_anchors(self, tmp_path):
+    def test_document_xml_anchors(self, single_comment_docx):
         """Test that document.xml has proper comment anchors."""
-        from lxml import etree
-        from zipfile import ZipFile
-
-        doc = Document()
-        para = doc.add_paragraph("This is test text to comment on.")
-        mgr = CommentManager(doc)
-
-        comment_id = mgr.add_comment(para, "Test comment", author_obj("Author"))
-
-        output_path = tmp_path / "test_anchors.docx"
-        doc.save(str(output_path))
-
-        with ZipFile(str(output_path), "r") as zf:
-            xml = etree.fromstring(zf.read("word/document.xml"))
+        parts, comment_id = single_comment_docx
+        xml = etree.fromstring(parts["word/document.xml"])
 
         ns_w = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
 
         # Find comment anchors
-        range_start = xml.find(f".//{{{ns_w}}}commentRangeStart")
-        range_end = xml.find(f".//{{{ns_w}}}commentRangeEnd")
-        comment_ref = xml.find(f".//{{{ns_w}}}commentReference")
+        range_starts = _XP_RANGE_START(xml)
+        range_ends = _XP_RANGE_END(xml)
+        comment_refs = _XP_REFERENCE(xml)
 
-        assert range_start is not None, "commentRangeStart not found"
-        assert range_end is not None, "commentRangeEnd not found"
-        assert comment_ref is not None, "commentReference not found"
+        assert range_starts, "commentRangeStart not found"
+        assert range_ends, "commentRangeEnd not found"
+        assert comment_refs, "commentReference not found"
+        range_start, range_end, comment_ref = range_starts[0], range_ends[0], comment_refs[0]
 
         # Verify IDs match
         assert range_start.get(f"{{{ns_w}}}id") == comment_id
         assert range_end.get(f"{{{ns_w}}}id") == comment_id
         assert comment_ref.get(f"{{{ns_w}}}id") == comment_id
 
-    def test_reply_anchor_ordering(self, tmp_path):
+    def test_reply_anchor_ordering(self, reply_thread_docx):
         """Ensure reply anchors keep commentRangeEnd before commentReference runs."""
-        from lxml import etree
-        from zipfile import ZipFile
-
-        doc = Document()
-        para = doc.add_paragraph("This is test text to comment on.")
-        mgr = CommentManager(doc)
-
-        root_id = mgr.add_comment(para, "Root comment", author_obj("Author"))
-        mgr.reply_to_comment(root_id, "Reply comment", author_obj("Author2"))
-
-        output_path = tmp_path / "test_reply_anchor_order.docx"
-        doc.save(str(output_path))
-
-        with ZipFile(str(output_path), "r") as zf:
-            xml = etree.fromstring(zf.read("word/document.xml"))
+        parts, root_id = reply_thread_docx
+        xml = etree.fromstring(parts["word/document.xml"])
 
         ns_w = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
-        range_start = xml.find(
-            f".//{{{ns_w}}}commentRangeStart[@{{{ns_w}}}id='{root_id}']"
-        )
-        assert range_start is not None
+        range_starts = _XP_RANGE_START_BY_ID(xml, cid=root_id)
+        assert range_starts
 
-        para_elem = range_start.getparent()
+        para_elem = range_starts[0].getparent()
         children = list(para_elem)
 
         end_indices = [
@@ -207,7 +186,7 @@ class TestWordOnlineCompatibility:
         assert ref_indices, "commentReference runs not found"
         assert max(end_indices) < min(ref_indices)
 
-    def test_full_roundtrip(self, tmp_path):
+    def test_full_roundtrip(self):
         """Test full save/reload roundtrip with all features."""
         doc = Document()
         para1 = doc.add_paragraph("First paragraph for comments")
@@ -221,11 +200,12 @@ class TestWordOnlineCompatibility:
         mgr.resolve_comment(id2)
 
         # Save
-        output_path = tmp_path / "test_roundtrip.docx"
-        doc.save(str(output_path))
+        buffer = BytesIO()
+        doc.save(buffer)
+        buffer.seek(0)
 
         # Reload
-        doc2 = Document(str(output_path))
+        doc2 = Document(buffer)
         mgr2 = CommentManager(doc2)
 
         # Verify comments
@@ -244,3 +224,169 @@ class TestWordOnlineCompatibility:
         # Find resolved thread
         resolved_thread = next(t for t in threads if t.root.text == "Comment on second para")
         assert resolved_thread.is_resolved
+
+    def test_new_comments_part_shares_tree(self):
+        """Wrappers over a newly created comments.xml share one parsed tree."""
+        from docx_comments.xml_parts import CommentsPart
+
+        doc = Document()
+        para = doc.add_paragraph("Test text")
+        mgr = CommentManager(doc)
+        mgr.add_comment(para, "First", author_obj("Author"))
+
+        part = CommentsPart(doc)._get_part()
+        assert CommentsPart(doc).xml is CommentsPart(doc).xml
+        assert len(CommentsPart(doc).xml) == 1
+        assert not hasattr(part, "_cached_root")
+
+    def test_comments_placeholder_replaced_by_created_part(self):
+        """A handler read before comments.xml exists picks up the part once created."""
+        from docx_comments.xml_parts import CommentsPart
+
+        doc = Document()
+        handler = CommentsPart(doc)
+        placeholder = handler.xml
+        assert len(placeholder) == 0
+
+        para = doc.add_paragraph("Test text")
+        CommentManager(doc).add_comment(para, "First", author_obj("Author"))
+
+        assert handler.xml is not placeholder
+        assert len(handler.xml) == 1
+
+    def test_metadata_getters_stream_large_parts(self, monkeypatch):
+        """Streamed and parsed metadata reads return the same entries."""
+        import docx_comments.xml_parts as xml_parts
+
+        doc = Document()
+        para = doc.add_paragraph("Test text")
+        mgr = CommentManager(doc)
+        root_id = mgr.add_comment(para, "Root", author_obj("Alice"))
+        mgr.reply_to_comment(root_id, "Reply", author_obj("Bob"))
+        mgr.resolve_comment(root_id)
+
+        parsed = (
+            xml_parts.CommentsExtendedPart(doc).get_threading_info(),
+            xml_parts.CommentsIdsPart(doc).get_durable_ids(),
+            xml_parts.CommentsExtensiblePart(doc).get_extensible_info(),
+        )
+        monkeypatch.setattr(xml_parts, "_STREAM_PARSE_THRESHOLD", 0)
+        streamed = (
+            xml_parts.CommentsExtendedPart(doc).get_threading_info(),
+            xml_parts.CommentsIdsPart(doc).get_durable_ids(),
+            xml_parts.CommentsExtensiblePart(doc).get_extensible_info(),
+        )
+
+        assert streamed == parsed
+        assert len(streamed[0]) == 2
+
+    def test_part_batch_writes_once(self):
+        """Part-level batches serialize the part when the outer batch exits."""
+        from docx_comments.xml_parts import CommentsIdsPart
+
+        doc = Document()
+        CommentManager(doc)
+        ids = CommentsIdsPart(doc)
+        part = ids._get_part()
+        blob_before = part.blob
+
+        with ids.batch():
+            ids.add_comment_id("00000001", "10000001")
+            with ids.batch():
+                ids.add_comment_id("00000002", "10000002")
+            assert part.blob is blob_before
+
+        assert part.blob is not blob_before
+        assert CommentsIdsPart(doc).get_durable_ids() == {
+            "00000001": "10000001",
+            "00000002": "10000002",
+        }
+
+    def test_namespaces_declared_once_per_part(self):
+        """Added entries reuse the root namespace declarations."""
+        from docx_comments.xml_parts import (
+            CommentsExtendedPart,
+            CommentsIdsPart,
+            CommentsPart,
+        )
+
+        doc = Document()
+        para = doc.add_paragraph("Test text")
+        mgr = CommentManager(doc)
+        root_id = mgr.add_comment(para, "Root", author_obj("Alice"))
+        mgr.reply_to_comment(root_id, "Reply", author_obj("Bob"))
+
+        for handler, prefixes in (
+            (CommentsPart(doc), (b"w", b"w14", b"w15", b"mc")),
+            (CommentsExtendedPart(doc), (b"w15", b"mc")),
+            (CommentsIdsPart(doc), (b"w16cid", b"mc")),
+        ):
+            blob = handler._get_part().blob
+            for prefix in prefixes:
+                assert blob.count(b"xmlns:" + prefix + b"=") == 1
+
+    def test_part_lookup_sees_new_parts(self):
+        """Handlers find parts related after an earlier lookup missed."""
+        from docx_comments.xml_parts import CommentsExtendedPart, CommentsIdsPart
+
+        doc = Document()
+        missed = CommentsExtendedPart(doc)
+        assert missed._get_part() is None
+
+        other = CommentsExtendedPart(doc)
+        other.ensure_exists()
+        assert missed._get_part() is other._get_part()
+        assert CommentsExtendedPart(doc)._get_part() is other._get_part()
+        assert CommentsIdsPart(doc)._get_part() is None
+        assert not hasattr(doc.part, "_comment_parts")
+
+    def test_managers_share_document_handlers(self):
+        """Managers on one document reuse the same part handlers."""
+        from docx_comments.xml_parts import ensure_comment_parts
+
+        doc = Document()
+        para = doc.add_paragraph("Test text")
+        first = CommentManager(doc)
+        second = CommentManager(doc)
+
+        assert second._ext_part is first._ext_part
+        assert second._people_part is first._people_part
+        assert second._get_threading() is first._get_threading()
+        assert ensure_comment_parts(doc)[0] is first._comments_handler
+
+        with first.batch():
+            second.add_comment(para, "Deferred", author_obj("Alice"))
+            assert first._ext_part._dirty
+        assert not first._ext_part._dirty
+        assert [c.text for c in CommentManager(doc).list_comments()] == ["Deferred"]
+
+    def test_ensure_comment_parts_reuses_handlers(self):
+        """Standalone calls share one set of handlers without any caller holding it."""
+        from docx_comments.xml_parts import ensure_comment_parts
+
+        doc = Document()
+        first = ensure_comment_parts(doc)
+        second = ensure_comment_parts(doc)
+
+        assert all(a is b for a, b in zip(first, second))
+
+    def test_comments_context_released_with_document(self):
+        """The shared context is kept off the document part and freed with it."""
+        import gc
+        import weakref
+
+        from docx_comments.xml_parts import _CONTEXTS
+
+        doc = Document()
+        mgr = CommentManager(doc)
+        assert _CONTEXTS.get(doc.part) is mgr._context
+        assert not hasattr(doc.part, "_comments_context")
+
+        del mgr
+        gc.collect()
+        assert doc.part in _CONTEXTS
+
+        doc_part = weakref.ref(doc.part)
+        del doc
+        gc.collect()
+        assert doc_part() is None